@@ -0,0 +1,87 @@
+"""
+AsyncParser class definition
+"""
+
+import codecs
+
+from exprail.parser import Parser
+from exprail.source import InputPending, SourceFeed
+
+
+class AsyncParser(object):
+    """Parse the input of an asynchronous stream reader"""
+
+    def __init__(self, grammar, reader, parser_class=Parser, chunk_size=4096, encoding='utf-8'):
+        """
+        Initialize the parser.
+        NOTE: The routing is synchronous, the reader is awaited only when the input buffer has been consumed!
+        :param grammar: a grammar object
+        :param reader: an object with awaitable read(n) method, for example an asyncio.StreamReader
+        :param parser_class: the class of the wrapped parser
+        :param chunk_size: the maximal size of the chunks which are read at once
+        :param encoding: the encoding of the bytes chunks
+        """
+        self._source = SourceFeed()
+        self._parser = parser_class(grammar, self._source)
+        self._reader = reader
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+
+    @property
+    def parser(self):
+        return self._parser
+
+    async def parse(self):
+        """
+        Parse the source stream while the parser has not become ready.
+        :return: None
+        """
+        while True:
+            try:
+                self._parser.parse()
+                return
+            except InputPending:
+                await self.read_chunk()
+
+    def get_token(self):
+        """
+        Get the recently parsed token.
+        :return: a token object
+        """
+        return self._parser.get_token()
+
+    async def get_next_token(self):
+        """
+        A convenience method for parsing and getting the last token at one step.
+        :return: a token object
+        """
+        await self.parse()
+        return self.get_token()
+
+    async def iter_tokens(self):
+        """
+        Lazily parse the source and yield the tokens of the parser.
+        NOTE: The finish token of the parser is not yielded!
+        :return: an asynchronous generator of token objects
+        """
+        while not self._parser.is_finished():
+            await self.parse()
+            if self._parser.is_finished():
+                return
+            yield self._parser.get_token()
+
+    def __aiter__(self):
+        return self.iter_tokens()
+
+    async def read_chunk(self):
+        """
+        Read the next chunk from the reader and feed it to the source.
+        :return: None
+        """
+        data = await self._reader.read(self._chunk_size)
+        is_finished = not data
+        if isinstance(data, bytes):
+            data = self._decoder.decode(data, final=is_finished)
+        self._source.feed(data)
+        if is_finished:
+            self._source.close()
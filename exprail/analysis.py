@@ -0,0 +1,110 @@
+"""
+Functions for the FIRST and FOLLOW set analysis of the grammar.
+"""
+
+from exprail.node import NodeType
+
+
+def get_next_positions(grammar, expression_name, node_id):
+    """
+    Get the positions where the routing continues from a non-consuming node.
+    :param grammar: a validated grammar object
+    :param expression_name: the name of the expression
+    :param node_id: the identifier of the node
+    :return: the list of (expression_name, node_id) positions
+    """
+    node = grammar.expressions[expression_name].nodes[node_id]
+    if node.type is NodeType.EXPRESSION:
+        callee_start_id = grammar.expressions[node.value].get_start_node_id()
+        return [(node.value, callee_start_id)]
+    target_node_ids = grammar.expressions[expression_name].get_target_node_ids(node_id)
+    return [(expression_name, target_id) for target_id in target_node_ids]
+
+
+def compute_first_sets(grammar):
+    """
+    Compute the FIRST sets of the nodes as the router sees them.
+    NOTE: The FIRST set of a node contains the first matchable nodes which can be reached from it
+    without passing a default or finish node!
+    :param grammar: a validated grammar object
+    :return: dictionary of (expression_name, node_id) positions and frozensets of matchable nodes
+    """
+    first_sets = {}
+    for expression_name, expression in grammar.expressions.items():
+        for node_id, node in expression.nodes.items():
+            if node.is_matchable():
+                first_sets[(expression_name, node_id)] = {node}
+            else:
+                first_sets[(expression_name, node_id)] = set()
+    is_changed = True
+    while is_changed:
+        is_changed = False
+        for expression_name, expression in grammar.expressions.items():
+            for node_id, node in expression.nodes.items():
+                if node.is_matchable() or node.is_default():
+                    continue
+                first_set = first_sets[(expression_name, node_id)]
+                n_items = len(first_set)
+                for position in get_next_positions(grammar, expression_name, node_id):
+                    first_set.update(first_sets[position])
+                if len(first_set) > n_items:
+                    is_changed = True
+    return {position: frozenset(first_set) for position, first_set in first_sets.items()}
+
+
+def compute_nullable_positions(grammar):
+    """
+    Collect the positions from where the finish node of the expression is reachable without token matching.
+    :param grammar: a validated grammar object
+    :return: the set of (expression_name, node_id) positions
+    """
+    nullable_positions = set()
+    for expression_name, expression in grammar.expressions.items():
+        for node_id, node in expression.nodes.items():
+            if node.type is NodeType.FINISH:
+                nullable_positions.add((expression_name, node_id))
+    is_changed = True
+    while is_changed:
+        is_changed = False
+        for expression_name, expression in grammar.expressions.items():
+            for node_id, node in expression.nodes.items():
+                position = (expression_name, node_id)
+                if position in nullable_positions or node.is_matchable() or node.is_default():
+                    continue
+                targets = [(expression_name, target_id) for target_id in expression.get_target_node_ids(node_id)]
+                is_nullable = any(target in nullable_positions for target in targets)
+                if node.type is NodeType.EXPRESSION:
+                    callee_start = (node.value, grammar.expressions[node.value].get_start_node_id())
+                    is_nullable = is_nullable and callee_start in nullable_positions
+                if is_nullable:
+                    nullable_positions.add(position)
+                    is_changed = True
+    return nullable_positions
+
+
+def compute_follow_sets(grammar, first_sets):
+    """
+    Compute the FOLLOW sets of the expressions.
+    NOTE: The FOLLOW set of an expression contains the matchable nodes which can follow its finish nodes!
+    :param grammar: a validated grammar object
+    :param first_sets: the FIRST sets of the grammar
+    :return: dictionary of expression names and frozensets of matchable nodes
+    """
+    nullable_positions = compute_nullable_positions(grammar)
+    follow_sets = {expression_name: set() for expression_name in grammar.expressions}
+    is_changed = True
+    while is_changed:
+        is_changed = False
+        for caller_name, caller in grammar.expressions.items():
+            for node_id, node in caller.nodes.items():
+                if node.type is not NodeType.EXPRESSION:
+                    continue
+                follow_set = follow_sets[node.value]
+                n_items = len(follow_set)
+                for target_id in caller.get_target_node_ids(node_id):
+                    follow_set.update(first_sets[(caller_name, target_id)])
+                    if (caller_name, target_id) in nullable_positions:
+                        follow_set.update(follow_sets[caller_name])
+                if len(follow_set) > n_items:
+                    is_changed = True
+    return {expression_name: frozenset(follow_set) for expression_name, follow_set in follow_sets.items()}
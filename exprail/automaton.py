@@ -0,0 +1,81 @@
+"""
+Automaton class definition
+"""
+
+
+class Automaton(object):
+    """Represents the character level transitions of a compiled grammar."""
+
+    def __init__(self, grammar):
+        """
+        Compile the transitions of the positions where all token classes are character sets.
+        NOTE: The ground fallback depends on the expression of the current state which can differ from the expression
+        of the position after returning from a call, so the ground transitions have no node identifier!
+        :param grammar: a compiled grammar object with classifier
+        """
+        self._transitions = {}
+        character_sets = {}
+        for expression_name, expression in grammar.expressions.items():
+            for node_id in expression.nodes:
+                candidates = grammar.routing_table.get_candidates(expression_name, node_id)
+                token_classes = grammar.routing_table.get_token_classes(expression_name, node_id)
+                for token_class in token_classes:
+                    if token_class not in character_sets:
+                        character_sets[token_class] = grammar.classifier.get_character_set(token_class)
+                if all(character_sets[token_class] is not None for token_class in token_classes):
+                    alphabet = set()
+                    for token_class in token_classes:
+                        alphabet.update(character_sets[token_class])
+                    transitions = {}
+                    for character in alphabet:
+                        matching_classes = {c for c in token_classes if character in character_sets[c]}
+                        transitions[character] = Automaton.select_transition(candidates, matching_classes)
+                    other = Automaton.select_transition(candidates, set())
+                    self._transitions[(expression_name, node_id)] = (transitions, other)
+
+    @staticmethod
+    def select_transition(candidates, matching_classes):
+        """
+        Select the transition from the candidates according to the matching token classes.
+        :param candidates: the routing candidates of the position
+        :param matching_classes: the set of token classes which contain the character
+        :return: a (is_ground, node_id) pair, where the node_id of the ground is None, or the error message as a string
+        """
+        matching_node_ids = []
+        default_node_ids = []
+        for node_id, matchers, is_default in candidates:
+            n_matching_successors = 0
+            for is_except, token_class in matchers:
+                if (token_class in matching_classes) is not is_except:
+                    n_matching_successors += 1
+            if n_matching_successors == 1:
+                matching_node_ids.append(node_id)
+            elif n_matching_successors > 1:
+                return 'There are multiple matching successors!'
+            if is_default:
+                default_node_ids.append(node_id)
+        if len(matching_node_ids) == 1:
+            return False, matching_node_ids[0]
+        elif len(default_node_ids) == 1:
+            return False, default_node_ids[0]
+        else:
+            return True, None
+
+    def find_transition(self, expression_name, node_id, character):
+        """
+        Find the transition from the given position by the character.
+        :param expression_name: the name of the expression of the base state
+        :param node_id: the node identifier of the base state
+        :param character: the value of the character token
+        :return: a (is_ground, node_id) pair or None, when the position has not compiled
+        NOTE: The node identifier of the ground transition is None, it must be resolved from the current state!
+        :raises RuntimeError: when the next state is missing or unambiguous
+        """
+        position = self._transitions.get((expression_name, node_id))
+        if position is None:
+            return None
+        transitions, other = position
+        transition = transitions.get(character, other)
+        if isinstance(transition, str):
+            raise RuntimeError(transition)
+        return transition
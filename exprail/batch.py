@@ -0,0 +1,96 @@
+"""
+Functions for parsing many independent inputs in parallel.
+"""
+
+import collections
+import concurrent.futures
+import os
+
+from exprail.source import SourceString
+
+_worker_context = None
+
+
+def get_parser_token(parser):
+    """
+    Get the recently parsed token of the parser as the result.
+    :param parser: the parser object after the parsing
+    :return: a token object
+    """
+    return parser.get_token()
+
+
+def parse_many(grammar, parser_class, inputs, workers=None, chunk_size=256, result=get_parser_token):
+    """
+    Parse the input strings with the same grammar.
+    NOTE: The grammar, the parser class and the result function are sent to each worker process only once,
+    so they must be picklable! At most two chunks per worker are submitted at once, so the inputs can be lazy.
+    :param grammar: a validated and compiled grammar object
+    :param parser_class: the class of the parsers
+    :param inputs: an iterable of input strings
+    :param workers: the number of the worker processes, None for the number of CPUs or 1 for the current process
+    :param chunk_size: the number of inputs which are sent to a worker at once
+    :param result: function which provides the result from the parser after the parsing
+    :return: the list of (value, error) pairs in the order of the inputs, the error is a (type name, message) pair
+    :raises ValueError: when the chunk size is not positive
+    """
+    if chunk_size < 1:
+        raise ValueError('The chunk size must be positive!')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1:
+        return parse_chunk(inputs, (grammar, parser_class, result))
+    results = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=initialize_worker,
+                                                initargs=(grammar, parser_class, result)) as executor:
+        pending = collections.deque()
+        for chunk in split_chunks(inputs, chunk_size):
+            if len(pending) == 2 * workers:
+                results.extend(pending.popleft().result())
+            pending.append(executor.submit(parse_chunk, chunk))
+        while pending:
+            results.extend(pending.popleft().result())
+    return results
+
+
+def split_chunks(inputs, chunk_size):
+    """
+    Split the inputs to lists.
+    :param inputs: an iterable of input strings
+    :param chunk_size: the maximal length of the lists
+    :return: a generator of the lists of inputs
+    """
+    chunk = []
+    for value in inputs:
+        chunk.append(value)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def initialize_worker(grammar, parser_class, result):
+    """Save the parsing context of the worker process."""
+    global _worker_context
+    _worker_context = (grammar, parser_class, result)
+
+
+def parse_chunk(inputs, context=None):
+    """
+    Parse the inputs of a chunk.
+    :param inputs: an iterable of input strings
+    :param context: the (grammar, parser_class, result) tuple or None for the context of the worker
+    :return: the list of (value, error) pairs
+    NOTE: The errors are returned as (type name, message) pairs, because the exceptions may not be picklable!
+    """
+    grammar, parser_class, result = context or _worker_context
+    results = []
+    for value in inputs:
+        try:
+            parser = parser_class(grammar, SourceString(value))
+            parser.parse()
+            results.append((result(parser), None))
+        except Exception as error:
+            results.append((None, (type(error).__name__, str(error))))
+    return results
@@ -0,0 +1,83 @@
+"""
+LRUCache class definition
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """Represents a bounded cache with least recently used eviction."""
+
+    def __init__(self, maxsize=1024):
+        """
+        Initialize an empty cache.
+        :param maxsize: the maximal number of the stored items
+        :raises ValueError: when the size is not positive
+        """
+        if maxsize < 1:
+            raise ValueError('The size of the cache must be positive!')
+        self._maxsize = maxsize
+        self._items = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=None):
+        """
+        Get the cached value of the key and mark it as recently used.
+        :param key: a hashable key
+        :param default: the returned value when the key is missing
+        :return: the cached value or the default
+        """
+        try:
+            value = self._items[key]
+        except KeyError:
+            self._misses += 1
+            return default
+        self._items.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Store the value and evict the least recently used item when the cache is full.
+        :param key: a hashable key
+        :param value: the cached value
+        :return: None
+        """
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self._maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        """Remove the items and reset the counters."""
+        self._items.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def get_stats(self):
+        """
+        Get the statistics of the cache usage.
+        :return: dictionary with hits, misses, size and maxsize keys
+        """
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'size': len(self._items),
+            'maxsize': self._maxsize
+        }
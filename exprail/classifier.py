@@ -1,7 +1,25 @@
 """
-Classifier class definition
+Classifier class definitions
 """
 
+from exprail.cache import LRUCache
+from exprail.node import NodeType
+
+
+def get_character_category(character):
+    """
+    Get the category of the character for the ranges of the class specifications.
+    :param character: a character as a string
+    :return: 'digit', 'lowercase', 'uppercase' or 'other'
+    """
+    if character.isdigit():
+        return 'digit'
+    elif character.islower():
+        return 'lowercase'
+    elif character.isupper():
+        return 'uppercase'
+    return 'other'
+
 
 class Classifier(object):
     """Represents the base class of the token classifiers."""
@@ -15,3 +33,222 @@ class Classifier(object):
         :return: True, when the token is in the class, else False
         """
         raise NotImplementedError('The classifier does not implemented!')
+
+    def is_in_classes(self, token_classes, token):
+        """
+        Select the classes of the token from the candidate classes at once.
+        NOTE: Subclasses can override it for answering with one lookup!
+        :param token_classes: the set of the candidate token class names
+        :param token: the considered token
+        :return: the set of the token classes which contain the token
+        """
+        return {token_class for token_class in token_classes if self.is_in_class(token_class, token)}
+
+    def bind(self, grammar):
+        """
+        Prepare the classifier for the token classes of the grammar.
+        NOTE: It is called on the compilation of the grammar!
+        :param grammar: the grammar object which uses the classifier
+        :return: None
+        """
+        pass
+
+    def are_disjoint(self, token_class, other_token_class):
+        """
+        Check that the token classes have no common token.
+        NOTE: It is used for proving that the grammar has no ambiguous routes!
+        :param token_class: the name of a token class as a string
+        :param other_token_class: the name of an other token class as a string
+        :return: True, when the classes are provably disjoint, else False
+        """
+        return False
+
+    @staticmethod
+    def get_character_set(token_class):
+        """
+        Get the characters of the token class for compiling the grammar to an automaton.
+        NOTE: The set must contain exactly the values of the 'char' tokens which are in the class!
+        :param token_class: the name of the token class as a string
+        :return: the set of characters or None, when the class is not a character set
+        """
+        return None
+
+
+class CachingClassifier(Classifier):
+    """Memoize the results of an other classifier."""
+
+    def __init__(self, classifier, maxsize=1024):
+        """
+        Wrap the classifier with a bounded cache.
+        :param classifier: the wrapped classifier object
+        :param maxsize: the maximal number of the cached classifications
+        """
+        self._classifier = classifier
+        self._cache = LRUCache(maxsize)
+
+    @property
+    def classifier(self):
+        return self._classifier
+
+    @property
+    def cache(self):
+        return self._cache
+
+    def is_in_class(self, token_class, token):
+        """
+        Check that whether the token is in the class or not by using the cache.
+        :param token_class: the name of the token class as a string
+        :param token: the considered token
+        :return: True, when the token is in the class, else False
+        """
+        key = (token_class, token.type, token.value)
+        result = self._cache.get(key)
+        if result is None:
+            result = bool(self._classifier.is_in_class(token_class, token))
+            self._cache.put(key, result)
+        return result
+
+    def bind(self, grammar):
+        """Bind the wrapped classifier to the grammar."""
+        self._classifier.bind(grammar)
+
+    def are_disjoint(self, token_class, other_token_class):
+        """Check the disjointness of the token classes by the wrapped classifier."""
+        return self._classifier.are_disjoint(token_class, other_token_class)
+
+    def get_character_set(self, token_class):
+        """Get the characters of the token class from the wrapped classifier."""
+        return self._classifier.get_character_set(token_class)
+
+    def get_stats(self):
+        """
+        Get the statistics of the cache usage.
+        :return: dictionary with hits, misses, size and maxsize keys
+        """
+        return self._cache.get_stats()
+
+
+class CharClassClassifier(Classifier):
+    """Classify character tokens by compiled character class specifications."""
+
+    def __init__(self, char_classes=None, type_classes=None):
+        """
+        Initialize the classifier.
+        NOTE: The other class names are parsed as the concatenation of characters and 'a-z' like ranges!
+        :param char_classes: dictionary of class names and their characters
+        :param type_classes: dictionary of class names and the non-character token types of the class
+        """
+        self._char_sets = {}
+        self._token_types = {}
+        self._char_index = {}
+        self._type_index = {}
+        if char_classes is not None:
+            for token_class, characters in char_classes.items():
+                self.add_char_set(token_class, frozenset(characters))
+        if type_classes is not None:
+            for token_class, token_type in type_classes.items():
+                self.add_char_set(token_class, frozenset())
+                self._token_types[token_class] = token_type
+                self._type_index[token_type] = self._type_index.get(token_type, frozenset()) | {token_class}
+
+    def add_char_set(self, token_class, characters):
+        """
+        Add the characters of the token class to the per-character index of the classes.
+        :param token_class: the name of the token class as a string
+        :param characters: the frozenset of the characters
+        :return: None
+        """
+        self._char_sets[token_class] = characters
+        for character in characters:
+            self._char_index[character] = self._char_index.get(character, frozenset()) | {token_class}
+
+    @staticmethod
+    def parse_class_spec(token_class):
+        """
+        Parse the characters of a class specification.
+        NOTE: The ranges are code point ranges, so their ends must be in the same category, digits, lowercase
+        or uppercase letters or other characters! The other classes can be defined by the char_classes.
+        :param token_class: the class specification as a string, for example '0-9', '+-' or 'a-zA-Z_'
+        :return: the frozenset of the characters
+        :raises ValueError: when the specification is empty or it has an invalid range
+        """
+        if token_class == '':
+            raise ValueError('Empty character class specification!')
+        characters = set()
+        index = 0
+        while index < len(token_class):
+            if index + 2 < len(token_class) and token_class[index + 1] == '-':
+                first, last = ord(token_class[index]), ord(token_class[index + 2])
+                if first > last:
+                    raise ValueError('Invalid character range in "{}"!'.format(token_class))
+                if get_character_category(token_class[index]) != get_character_category(token_class[index + 2]):
+                    raise ValueError('Mixed character categories in the range of "{}"!'.format(token_class))
+                characters.update(chr(code) for code in range(first, last + 1))
+                index += 3
+            else:
+                characters.add(token_class[index])
+                index += 1
+        return frozenset(characters)
+
+    def bind(self, grammar):
+        """
+        Compile the token classes of the grammar.
+        :param grammar: the grammar object which uses the classifier
+        :return: None
+        :raises ValueError: when a class specification is invalid
+        """
+        class_node_types = {NodeType.TOKEN, NodeType.EXCEPT_TOKEN, NodeType.ROUTER, NodeType.EXCEPT_ROUTER}
+        for expression in grammar.expressions.values():
+            for node in expression.nodes.values():
+                if node.type in class_node_types and node.value not in self._char_sets:
+                    self.add_char_set(node.value, self.parse_class_spec(node.value))
+
+    def is_in_class(self, token_class, token):
+        """
+        Check that whether the token is in the class or not.
+        :param token_class: the name of the token class as a string
+        :param token: the considered token
+        :return: True, when the token is in the class, else False
+        :raises ValueError: when the token class has not been bound
+        """
+        if token.type == 'char':
+            try:
+                return token.value in self._char_sets[token_class]
+            except KeyError:
+                raise ValueError('The token class "{}" has not been bound!'.format(token_class))
+        return self._token_types.get(token_class) == token.type
+
+    def is_in_classes(self, token_classes, token):
+        """
+        Select the classes of the token from the candidate classes at once.
+        NOTE: It intersects the candidates with the indexed classes of the character or the token type,
+        so the classes which have not been bound never match!
+        :param token_classes: the set of the candidate token class names
+        :param token: the considered token
+        :return: the frozenset of the token classes which contain the token
+        """
+        if token.type == 'char':
+            return self._char_index.get(token.value, frozenset()) & token_classes
+        return self._type_index.get(token.type, frozenset()) & token_classes
+
+    def are_disjoint(self, token_class, other_token_class):
+        """
+        Check that the token classes have no common token.
+        :param token_class: the name of a token class as a string
+        :param other_token_class: the name of an other token class as a string
+        :return: True, when the classes are disjoint, else False
+        """
+        if token_class in self._token_types or other_token_class in self._token_types:
+            return self._token_types.get(token_class) != self._token_types.get(other_token_class)
+        return self.get_character_set(token_class).isdisjoint(self.get_character_set(other_token_class))
+
+    def get_character_set(self, token_class):
+        """
+        Get the characters of the token class.
+        :param token_class: the name of the token class as a string
+        :return: the frozenset of characters
+        :raises ValueError: when the token class has not been bound
+        """
+        if token_class not in self._char_sets:
+            raise ValueError('The token class "{}" has not been bound!'.format(token_class))
+        return self._char_sets[token_class]
@@ -11,7 +11,10 @@ class Expression(object):
     def __init__(self, index=None):
         self._nodes = {}
         self._edges = {}
+        self._sources = {}
         self._index = index
+        self._start_node_id = None
+        self._ground_node_id = None
 
     @property
     def nodes(self):
@@ -24,40 +27,68 @@ class Expression(object):
         """
         return self._index == 0
 
+    def get_index(self):
+        """
+        Get the index of the expression in the grammar description.
+        :return: the index as an integer or None
+        """
+        return self._index
+
     def add_node(self, node_id, node):
         """Add new node to the expression."""
         self._nodes[node_id] = node
+        self._start_node_id = self.update_node_index(self._start_node_id, NodeType.START, node_id, node)
+        self._ground_node_id = self.update_node_index(self._ground_node_id, NodeType.GROUND, node_id, node)
+
+    def update_node_index(self, indexed_node_id, node_type, node_id, node):
+        """
+        Get the updated identifier of the first node with the given type.
+        :param indexed_node_id: the currently indexed node identifier or None
+        :param node_type: the type of the indexed node
+        :param node_id: the identifier of the added node
+        :param node: the added node
+        :return: the node identifier or None, when there is no node with the given type
+        """
+        if indexed_node_id is None:
+            if node.type is node_type:
+                return node_id
+        elif indexed_node_id == node_id and node.type is not node_type:
+            for other_node_id, other_node in self._nodes.items():
+                if other_node.type is node_type:
+                    return other_node_id
+            return None
+        return indexed_node_id
 
     def add_edge(self, source_id, target_id):
         """Add new edge to the expression."""
         if source_id not in self._edges:
             self._edges[source_id] = set()
         self._edges[source_id].add(target_id)
+        if target_id not in self._sources:
+            self._sources[target_id] = set()
+        self._sources[target_id].add(source_id)
 
     def get_start_node_id(self):
         """
         Get the identifier of the start node of the expression graph.
         :return: the identifier of the start node
         """
-        for node_id, node in self._nodes.items():
-            if node.type is NodeType.START:
-                return node_id
-        raise RuntimeError('The start node is missing from the expression!')
+        if self._start_node_id is None:
+            raise RuntimeError('The start node is missing from the expression!')
+        return self._start_node_id
 
     def get_source_node_ids(self, node_id):
         """
         Get the identifiers of the source nodes of the given node.
         :param node_id: the identifier of the reference node
-        :return: the set of target node identifiers
+        :return: the set of source node identifiers
         :raises ValueError: when the node identifier is invalid
         """
         if node_id not in self._nodes:
             raise ValueError('The node id {} is invalid!'.format(node_id))
-        source_ids = set()
-        for source_id, target_ids in self._edges.items():
-            if node_id in target_ids:
-                source_ids.add(source_id)
-        return source_ids
+        if node_id not in self._sources:
+            return set()
+        return self._sources[node_id]
 
     def get_target_node_ids(self, node_id):
         """
@@ -77,10 +108,7 @@ class Expression(object):
         Check that is there a ground node in the expression.
         :return: True, when there is a ground node in the expression, else False
         """
-        for node in self._nodes.values():
-            if node.type is NodeType.GROUND:
-                return True
-        return False
+        return self._ground_node_id is not None
 
     def get_ground_node_id(self):
         """
@@ -88,7 +116,6 @@ class Expression(object):
         :return: the ground node identifier
         :raises RuntimeError: when the ground node does not exists
         """
-        for node_id, node in self._nodes.items():
-            if node.type is NodeType.GROUND:
-                return node_id
-        raise RuntimeError('There is no ground node!')
+        if self._ground_node_id is None:
+            raise RuntimeError('There is no ground node!')
+        return self._ground_node_id
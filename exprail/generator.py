@@ -0,0 +1,295 @@
+"""
+Functions for generating Python parser programs from grammars.
+"""
+
+import hashlib
+import importlib.util
+import os
+import types
+
+from exprail.grammar import Grammar
+from exprail.node import NodeType
+
+GENERATOR_VERSION = '6'
+
+ACTION_CALLS = {
+    NodeType.INFO: 'parser.show_info({}, token)',
+    NodeType.ERROR: 'parser.show_error({}, token)',
+    NodeType.CLEAN: 'parser.clean_stack({}, token)'
+}
+
+BOUND_ACTION_CALLS = {
+    NodeType.TRANSFORMATION: 'parser._token = {}(token)',
+    NodeType.OPERATION: '{}(token)',
+    NodeType.STACK: '{}(token)'
+}
+
+CONSUMING_NODE_TYPES = {NodeType.TOKEN, NodeType.EXCEPT_TOKEN, NodeType.DEFAULT_TOKEN}
+
+
+def generate_source(grammar):
+    """
+    Generate the source of a parser program from the grammar.
+    NOTE: The expressions are plain functions which return to the main loop of the program on calls, returns
+    and suspensions, so the nesting of the expressions is stored in an explicit frame stack!
+    :param grammar: a validated and compiled grammar object
+    :return: the source of the Python module as a string
+    :raises ValueError: when the grammar has not compiled
+    """
+    if grammar.routing_table is None:
+        raise ValueError('The grammar must be compiled before the code generation!')
+    expression_names = sorted(grammar.expressions)
+    function_names = {name: '_expression_{}'.format(index) for index, name in enumerate(expression_names)}
+    entry_name = grammar.get_entry_expression_name()
+    action_indices = {}
+    for expression_name in expression_names:
+        expression = grammar.expressions[expression_name]
+        for node_id in sorted(expression.nodes):
+            node = expression.nodes[node_id]
+            if node.type in BOUND_ACTION_CALLS:
+                action_indices.setdefault((node.type, node.value), len(action_indices))
+    class_constants = {}
+    functions = []
+    for expression_name in expression_names:
+        functions.extend(['', ''])
+        functions.extend(generate_expression_function(grammar, expression_name, function_names, class_constants,
+                                                      action_indices))
+    lines = [
+        '"""',
+        'Generated exprail parser program',
+        'NOTE: Do not modify it manually!',
+        '"""',
+        '',
+        'from exprail.node import NodeType',
+        'from exprail.source import InputPending',
+        ''
+    ]
+    for token_classes, constant_name in class_constants.items():
+        lines.append('{} = frozenset({})'.format(constant_name, repr(sorted(token_classes))))
+    lines.extend([
+        '',
+        '',
+        'def run(parser):',
+        '    """Run the program of the parser until the finish of the entry expression."""',
+        '    actions = ['
+    ])
+    for (node_type, value), _ in sorted(action_indices.items(), key=lambda item: item[1]):
+        lines.append('        parser.get_action_handler(NodeType.{}, {}),'.format(node_type.name, repr(value)))
+    lines.extend([
+        '    ]',
+        '    frames = []',
+        '    function = {}'.format(function_names[entry_name]),
+        '    node_id = {}'.format(grammar.expressions[entry_name].get_start_node_id()),
+        '    while True:',
+        '        result = function(parser, actions, node_id)',
+        '        if result is None:',
+        '            if not frames:',
+        '                break',
+        '            function, node_id = frames.pop()',
+        '        elif result[0] is None:',
+        '            node_id = result[1]',
+        '            yield',
+        '        else:',
+        '            frames.append((function, result[2]))',
+        '            function, node_id = result[0], result[1]',
+        '    parser._token = parser.get_finish_token()',
+        '    parser._ready = True',
+        '    parser._finished = True',
+        '    yield',
+        '    raise RuntimeError(\'The top level expression finish nodes have no successors!\')'
+    ])
+    lines.extend(functions)
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def generate_expression_function(grammar, expression_name, function_names, class_constants, action_indices):
+    """
+    Generate the function of an expression.
+    NOTE: The function processes the node_id node and routes from it. The negative ~node_id entries only route
+    from the node, they are used for continuing after the returns and the suspensions!
+    The function returns None at the finish, (None, entry_id) on suspension
+    and (callee, callee_node_id, entry_id) for calling an other expression.
+    :param grammar: the compiled grammar object
+    :param expression_name: the name of the expression
+    :param function_names: dictionary of expression names and function names
+    :param class_constants: dictionary of the token class sets and their constant names
+    :param action_indices: dictionary of the actions and the indices of their bound handlers
+    :return: the list of source lines
+    """
+    expression = grammar.expressions[expression_name]
+    lines = [
+        'def {}(parser, actions, node_id):'.format(function_names[expression_name]),
+        '    # Expression {}'.format(repr(expression_name)),
+        '    source = parser._source',
+        '    is_in_classes = parser._grammar.classifier.is_in_classes',
+        '    while True:'
+    ]
+    keyword = 'if'
+    for node_id in sorted(expression.nodes):
+        node = expression.nodes[node_id]
+        processing = generate_node_processing(grammar, node_id, node, function_names, action_indices)
+        lines.append('        {} node_id == {}:'.format(keyword, node_id))
+        keyword = 'elif'
+        if node.type is NodeType.FINISH:
+            lines.extend('            ' + line for line in processing)
+            continue
+        routing = generate_node_routing(grammar, expression_name, node_id, node, function_names, class_constants)
+        if node.type is NodeType.EXPRESSION:
+            lines.extend('            ' + line for line in processing)
+        else:
+            lines.extend('            ' + line for line in processing + routing)
+        lines.append('        elif node_id == {}:'.format(~node_id))
+        lines.extend('            ' + line for line in routing)
+    lines.append('        else:')
+    lines.append('            raise RuntimeError(\'The node {} is missing from the program!\'.format(node_id))')
+    return lines
+
+
+def generate_node_processing(grammar, node_id, node, function_names, action_indices):
+    """
+    Generate the processing of the node.
+    :param grammar: the compiled grammar object
+    :param node_id: the identifier of the node
+    :param node: the node object
+    :param function_names: dictionary of expression names and function names
+    :param action_indices: dictionary of the actions and the indices of their bound handlers
+    :return: the list of source lines which are relative to the block of the node
+    """
+    if node.type is NodeType.FINISH:
+        return ['return None']
+    elif node.type is NodeType.EXPRESSION:
+        callee_start_id = grammar.expressions[node.value].get_start_node_id()
+        return ['return {}, {}, {}'.format(function_names[node.value], callee_start_id, ~node_id)]
+    elif node.type in ACTION_CALLS or node.type in BOUND_ACTION_CALLS:
+        if node.type in ACTION_CALLS:
+            action_call = ACTION_CALLS[node.type].format(repr(node.value))
+        else:
+            action = 'actions[{}]'.format(action_indices[(node.type, node.value)])
+            action_call = BOUND_ACTION_CALLS[node.type].format(action)
+        return [
+            action_call,
+            'if parser._ready:',
+            '    return None, {}'.format(~node_id)
+        ]
+    elif node.type in CONSUMING_NODE_TYPES:
+        return ['parser._is_token_consumed = True']
+    return []
+
+
+def generate_node_routing(grammar, expression_name, node_id, node, function_names, class_constants):
+    """
+    Generate the fetching of the token and the routing from the node.
+    :param grammar: the compiled grammar object
+    :param expression_name: the name of the expression of the node
+    :param node_id: the identifier of the node
+    :param node: the node object
+    :param function_names: dictionary of expression names and function names
+    :param class_constants: dictionary of the token class sets and their constant names
+    :return: the list of source lines which are relative to the block of the node
+    """
+    routing_table = grammar.routing_table
+    candidates = routing_table.get_candidates(expression_name, node_id)
+    token_classes = routing_table.get_token_classes(expression_name, node_id)
+    default_node_ids = [target_id for target_id, _, is_default in candidates if is_default]
+    if len(default_node_ids) == 1:
+        fallback = ['node_id = {}'.format(default_node_ids[0])]
+    elif node.type is NodeType.EXPRESSION and routing_table.get_ground_node_id(node.value) is not None:
+        callee_ground_id = routing_table.get_ground_node_id(node.value)
+        fallback = ['return {}, {}, {}'.format(function_names[node.value], callee_ground_id, ~node_id)]
+    elif node.type is not NodeType.EXPRESSION and routing_table.get_ground_node_id(expression_name) is not None:
+        fallback = ['node_id = {}'.format(routing_table.get_ground_node_id(expression_name))]
+    else:
+        fallback = ['raise RuntimeError(\'There is no possible next state!\')']
+    lines = [
+        'try:',
+        '    if parser._is_token_consumed:',
+        '        source.parse()',
+        '        parser._is_token_consumed = False',
+        '    token = source.get_token()',
+        'except InputPending:',
+        '    return None, {}'.format(~node_id)
+    ]
+    lines.extend(generate_routing(candidates, token_classes, class_constants, fallback))
+    return lines
+
+
+def generate_routing(candidates, token_classes, class_constants, fallback):
+    """
+    Generate the inlined routing code which selects the next node identifier.
+    :param candidates: the routing candidates of the node
+    :param token_classes: the token classes of the candidates
+    :param class_constants: dictionary of the token class sets and their constant names
+    :param fallback: the source lines for the case when there is no matching candidate
+    :return: the list of source lines
+    """
+    if not token_classes:
+        return fallback
+    if token_classes not in class_constants:
+        class_constants[token_classes] = '_TOKEN_CLASSES_{}'.format(len(class_constants))
+    lines = [
+        'matching_classes = is_in_classes({}, token)'.format(class_constants[token_classes]),
+        'n_matching_states = 0',
+        'next_id = None'
+    ]
+    for target_id, matchers, _ in candidates:
+        if not matchers:
+            continue
+        terms = []
+        for is_except, token_class in matchers:
+            operator = 'not in' if is_except else 'in'
+            terms.append('({} {} matching_classes)'.format(repr(token_class), operator))
+        if len(terms) == 1:
+            lines.append('if {}:'.format(terms[0]))
+        else:
+            lines.append('n_matching_successors = {}'.format(' + '.join(terms)))
+            lines.append('if n_matching_successors > 1:')
+            lines.append('    raise RuntimeError(\'There are multiple matching successors!\')')
+            lines.append('if n_matching_successors == 1:')
+        lines.append('    n_matching_states += 1')
+        lines.append('    next_id = {}'.format(target_id))
+    lines.append('if n_matching_states == 1:')
+    lines.append('    node_id = next_id')
+    lines.append('else:')
+    lines.extend('    ' + line for line in fallback)
+    return lines
+
+
+def get_grammar_hash(filename):
+    """
+    Calculate the hash of the grammar file for the program cache.
+    :param filename: the path of the grammar file
+    :return: the hexadecimal digest as a string
+    """
+    digest = hashlib.sha256(GENERATOR_VERSION.encode('ascii'))
+    with open(filename, 'rb') as grammar_file:
+        digest.update(grammar_file.read())
+    return digest.hexdigest()
+
+
+def load_program(filename, cache_dir=None):
+    """
+    Load the parser program of a grammar file.
+    NOTE: The generated module is stored in the cache directory and reused while the grammar file is unchanged!
+    :param filename: the path of the grammar file
+    :param cache_dir: the directory of the generated modules or None for generating it in memory
+    :return: the module object of the program
+    """
+    if cache_dir is None:
+        source = generate_source(Grammar(filename))
+        module = types.ModuleType('exprail_program')
+        exec(compile(source, '<exprail program of {}>'.format(filename), 'exec'), module.__dict__)
+        return module
+    module_name = 'exprail_{}'.format(get_grammar_hash(filename))
+    path = os.path.join(cache_dir, module_name + '.py')
+    if not os.path.isfile(path):
+        source = generate_source(Grammar(filename))
+        os.makedirs(cache_dir, exist_ok=True)
+        temporary_path = '{}.{}.tmp'.format(path, os.getpid())
+        with open(temporary_path, 'w') as program_file:
+            program_file.write(source)
+        os.replace(temporary_path, path)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
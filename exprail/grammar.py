@@ -2,9 +2,27 @@
 Grammar class definition
 """
 
+from exprail import analysis
+from exprail.automaton import Automaton
+from exprail.cache import LRUCache
 from exprail import loader
+from exprail import serializer
 from exprail import validator
 from exprail.state import State
+from exprail.table import RoutingTable
+
+
+def restore_grammar(data, classifier, is_trusted):
+    """
+    Restore the pickled grammar.
+    :param data: the serialized grammar
+    :param classifier: the classifier of the grammar or None
+    :param is_trusted: the routing is trusted or not
+    :return: the compiled grammar object
+    """
+    grammar = Grammar.from_bytes(data, classifier)
+    grammar._is_trusted = is_trusted
+    return grammar
 
 
 class Grammar(object):
@@ -13,9 +31,25 @@ class Grammar(object):
     def __init__(self, filename=None, classifier=None):
         self._classifier = classifier
         self._expressions = {}
+        self._entry_expression_name = None
+        self._routing_table = None
+        self._automaton = None
+        self._successor_cache = None
+        self._state_pool = None
+        self._program = None
+        self._is_trusted = False
+        self._first_sets = None
+        self._follow_sets = None
+        self._node_values = {}
+        self._initial_state = None
         if filename is not None:
             self.load_from_file(filename)
             self.validate()
+            self.compile()
+
+    def __reduce__(self):
+        # NOTE: The caches and the generated program are not pickled!
+        return restore_grammar, (self.to_bytes(), self._classifier, self._is_trusted)
 
     @property
     def classifier(self):
@@ -25,34 +59,258 @@ class Grammar(object):
     def expressions(self):
         return self._expressions
 
+    @property
+    def routing_table(self):
+        return self._routing_table
+
+    @property
+    def automaton(self):
+        return self._automaton
+
+    @property
+    def program(self):
+        return self._program
+
+    @property
+    def successor_cache(self):
+        return self._successor_cache
+
     def set_classifier(self, classifier):
         """Set the token classifier of the grammar."""
         self._classifier = classifier
+        if self._routing_table is not None:
+            self.compile()
+
+    def set_program(self, program):
+        """
+        Set the generated parser program of the grammar.
+        NOTE: The parsers of the grammar run the program instead of the routing of the states!
+        :param program: a module from the generator or None for the interpreted parsing
+        :return: None
+        """
+        self._program = program
+
+    def is_trusted(self):
+        """
+        Signs that the grammar has been proven to have no ambiguous routes.
+        :return: True, when the router can stop at the first match, else False
+        """
+        return self._is_trusted
+
+    def enable_trusted_routing(self):
+        """
+        Prove that the grammar has no ambiguous routes and enable the first match routing.
+        :return: None
+        :raises RuntimeError: when there are nodes with possibly ambiguous routes
+        """
+        ambiguous_nodes = validator.find_ambiguous_nodes(self)
+        if ambiguous_nodes:
+            nodes = ', '.join('{} of "{}"'.format(node_id, name) for name, node_id in ambiguous_nodes)
+            raise RuntimeError('Ambiguous routes from the nodes {}!'.format(nodes))
+        self._is_trusted = True
+
+    def disable_trusted_routing(self):
+        """Check the ambiguity of the routes on each routing step."""
+        self._is_trusted = False
+
+    def enable_successor_cache(self, maxsize=1024):
+        """
+        Cache the successor states of the states of the grammar.
+        NOTE: The routing of the compiled grammars does not walk the successor states,
+        so the cache is used only by the routing of uncompiled grammars, and by the validation
+        and the compilation which are called after enabling it!
+        :param maxsize: the maximal number of the cached states
+        :return: None
+        """
+        self._successor_cache = LRUCache(maxsize)
+
+    def disable_successor_cache(self):
+        """Drop the successor cache of the grammar."""
+        self._successor_cache = None
+
+    def enable_state_interning(self):
+        """
+        Create each unique state of the grammar only once and reuse it.
+        NOTE: The pool keeps all of the created states until the interning is disabled!
+        :return: None
+        """
+        self._state_pool = {}
+        self._initial_state = None
+
+    def disable_state_interning(self):
+        """Drop the interned states of the grammar."""
+        self._state_pool = None
+        self._initial_state = None
+
+    def create_state(self, expression_name, node_id, return_state=None):
+        """
+        Create a state of the grammar or get the interned one.
+        :param expression_name: the name of the expression
+        :param node_id: the identifier of the node in the expression
+        :param return_state: the state where the expression returns or None
+        :return: a state object
+        """
+        if self._state_pool is None:
+            return State(self, expression_name, node_id, return_state)
+        key = (expression_name, node_id, return_state)
+        state = self._state_pool.get(key)
+        if state is None:
+            state = State(self, expression_name, node_id, return_state)
+            self._state_pool[key] = state
+        return state
 
     def add_expression(self, name, expression):
         """Add new expression to the grammar."""
         self._expressions[name] = expression
+        if expression.is_entry_expression():
+            if self._entry_expression_name is None:
+                self._entry_expression_name = name
+        elif self._entry_expression_name == name:
+            self.update_entry_expression_name()
+        self.reset_compilation()
 
     def load_from_file(self, filename):
         """Load the grammar from a grammar description."""
         self._expressions = loader.load_expressions(filename)
+        self.update_entry_expression_name()
+        self.reset_compilation()
+
+    def to_bytes(self):
+        """
+        Serialize the expressions and the routing table of the grammar.
+        NOTE: The classifier and the character automaton are not serialized!
+        :return: the serialized grammar as bytes
+        """
+        return serializer.dump_grammar(self._expressions, self._routing_table)
+
+    @classmethod
+    def from_bytes(cls, data, classifier=None):
+        """
+        Load the grammar from its serialized expressions and routing table.
+        NOTE: Only the character automaton is built again, when the grammar has been compiled before the serialization!
+        :param data: the serialized grammar as bytes
+        :param classifier: the classifier of the grammar
+        :return: the compiled grammar object
+        :raises ValueError: when the data is not a serialized grammar
+        """
+        grammar = cls(classifier=classifier)
+        grammar._expressions, routing_table = serializer.load_grammar(data)
+        grammar.update_entry_expression_name()
+        if routing_table is None:
+            grammar.compile()
+        else:
+            grammar._routing_table = routing_table
+            grammar.compile_automaton()
+        return grammar
+
+    def reset_compilation(self):
+        """Drop the compiled and cached data which depend on the expressions."""
+        self._routing_table = None
+        self._automaton = None
+        self._program = None
+        self._is_trusted = False
+        self._first_sets = None
+        self._follow_sets = None
+        self._node_values = {}
+        self._initial_state = None
+        if self._successor_cache is not None:
+            self._successor_cache.clear()
+        if self._state_pool is not None:
+            self._state_pool.clear()
 
     def validate(self):
-        """Validate the grammar."""
+        """
+        Validate the grammar and bind the classifier to it.
+        NOTE: The classifier is bound again on the compilation!
+        :return: None
+        """
         validator.validate_grammar(self)
+        if self._classifier is not None:
+            self._classifier.bind(self)
+
+    def compile(self):
+        """
+        Precompile the routing table and the character automaton of the grammar.
+        NOTE: The grammar must be compiled again after the modification of its expressions!
+        :return: None
+        """
+        self._routing_table = RoutingTable(self)
+        self._is_trusted = False
+        self.compile_automaton()
+
+    def compile_automaton(self):
+        """
+        Bind the classifier and compile the character automaton from the routing table.
+        :return: None
+        """
+        if self._classifier is not None:
+            self._classifier.bind(self)
+            self._automaton = Automaton(self)
+        else:
+            self._automaton = None
 
     def get_initial_state(self):
         """
         Get the initial state of the grammar.
+        NOTE: The state is created once and shared by the parsers of the grammar!
         :return: the State object of the grammar
         """
-        expression_name = self.get_entry_expression_name()
-        node_id = self.expressions[expression_name].get_start_node_id()
-        return State(self, expression_name, node_id, None)
+        if self._initial_state is None:
+            expression_name = self.get_entry_expression_name()
+            node_id = self.expressions[expression_name].get_start_node_id()
+            self._initial_state = self.create_state(expression_name, node_id, None)
+        return self._initial_state
+
+    def get_node_values(self, node_type):
+        """
+        Get the values of the nodes with the given type.
+        :param node_type: a NodeType member
+        :return: the frozenset of the node values
+        """
+        if node_type not in self._node_values:
+            self._node_values[node_type] = frozenset(
+                node.value
+                for expression in self._expressions.values()
+                for node in expression.nodes.values()
+                if node.type is node_type
+            )
+        return self._node_values[node_type]
+
+    def get_first_set(self, expression_name, node_id=None):
+        """
+        Get the FIRST set of the node or the expression.
+        :param expression_name: the name of the expression
+        :param node_id: the identifier of the node or None for the start node of the expression
+        :return: the frozenset of the first matchable nodes
+        """
+        if self._first_sets is None:
+            self._first_sets = analysis.compute_first_sets(self)
+        if node_id is None:
+            node_id = self._expressions[expression_name].get_start_node_id()
+        return self._first_sets[(expression_name, node_id)]
+
+    def get_follow_set(self, expression_name):
+        """
+        Get the FOLLOW set of the expression.
+        :param expression_name: the name of the expression
+        :return: the frozenset of the matchable nodes which can follow the expression
+        """
+        if self._follow_sets is None:
+            if self._first_sets is None:
+                self._first_sets = analysis.compute_first_sets(self)
+            self._follow_sets = analysis.compute_follow_sets(self, self._first_sets)
+        return self._follow_sets[expression_name]
 
     def get_entry_expression_name(self):
         """Get the name of the entry expression."""
+        if self._entry_expression_name is None:
+            raise RuntimeError('The entry expression is missing!')
+        return self._entry_expression_name
+
+    def update_entry_expression_name(self):
+        """Find the name of the entry expression for the index."""
+        self._entry_expression_name = None
         for expression_name, expression in self._expressions.items():
             if expression.is_entry_expression():
-                return expression_name
-        raise RuntimeError('The entry expression is missing!')
+                self._entry_expression_name = expression_name
+                return
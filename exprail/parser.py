@@ -2,38 +2,246 @@
 Parser class definition
 """
 
+import functools
+
 from exprail.node import NodeType
 from exprail import router
-from exprail.state import State
+from exprail.source import InputPending, Source
+from exprail.stack import SpanStack
+
+NODE_HANDLER_NAMES = {
+    NodeType.EXPRESSION: 'process_expression_node',
+    NodeType.FINISH: 'process_finish_node',
+    NodeType.INFO: 'process_info_node',
+    NodeType.ERROR: 'process_error_node',
+    NodeType.TRANSFORMATION: 'process_transformation_node',
+    NodeType.OPERATION: 'process_operation_node',
+    NodeType.STACK: 'process_stack_node',
+    NodeType.CLEAN: 'process_clean_node',
+    NodeType.TOKEN: 'process_token_node',
+    NodeType.EXCEPT_TOKEN: 'process_token_node',
+    NodeType.DEFAULT_TOKEN: 'process_token_node'
+}
+
+ACTION_METHOD_NAMES = {
+    NodeType.OPERATION: 'operate',
+    NodeType.TRANSFORMATION: 'transform',
+    NodeType.STACK: 'push_stack'
+}
+
+
+def register_action(node_type, name):
+    """
+    Register the decorated parser method as the handler of the named action.
+    :param node_type: the type of the action nodes
+    :param name: the value of the action nodes
+    :return: the decorator function
+    """
+    def decorator(method):
+        if not hasattr(method, 'exprail_actions'):
+            method.exprail_actions = []
+        method.exprail_actions.append((node_type, name))
+        return method
+    return decorator
+
+
+def operation(name):
+    """Register the decorated method as the handler of the operation with the given name."""
+    return register_action(NodeType.OPERATION, name)
+
+
+def transformation(name):
+    """Register the decorated method as the handler of the transformation with the given name."""
+    return register_action(NodeType.TRANSFORMATION, name)
+
+
+def stack(name):
+    """Register the decorated method as the handler of the stack with the given name."""
+    return register_action(NodeType.STACK, name)
 
 
 class Parser(object):
     """The base class for other parsers"""
 
+    node_handler_names = NODE_HANDLER_NAMES
+    use_span_stacks = False
+
     def __init__(self, grammar, source):
         """
         Initialize the parser.
         :param grammar: a grammar object
-        :param source: a parser object which provides the source token stream
+        :param source: a source or parser object which provides the source token stream
+        :raises ValueError: when the grammar has a generated program and the parser has custom node handlers
         """
         self._grammar = grammar
         self._state = grammar.get_initial_state()
         self._source = source
-        self._source.parse()
+        self._is_token_consumed = True
+        self._buffer = source.get_buffer()
         self._ready = False
+        self._finished = False
         self._token = None
-        self._stacks = {'': []}
+        self._stacks = {'': self.create_stack()}
+        self._node_handlers = self.get_node_handlers()
+        self._action_handlers = {}
+        for node_type in ACTION_METHOD_NAMES:
+            for name in grammar.get_node_values(node_type):
+                self._action_handlers[(node_type, name)] = self.bind_action_handler(node_type, name)
+        if grammar.program is not None:
+            if self._node_handlers != Parser.get_node_handlers():
+                raise ValueError('The generated programs do not support custom node handlers!')
+            self._runner = grammar.program.run(self)
+        else:
+            self._runner = None
 
     def parse(self):
         """
         Parse the source stream while the parser has not become ready.
+        NOTE: The parser keeps its finish token after the finish, so it can be the source of an other parser!
+        The source is advanced lazily before the next token is requested, so the parsing can be continued
+        when the source raises InputPending!
         :return: None
         """
+        if self._finished:
+            return
         self._ready = False
+        if self._runner is not None:
+            next(self._runner)
+            if not self._ready:
+                raise InputPending('The source is waiting for input!')
+            return
+        routing_table = self._grammar.routing_table
         while not self._ready:
+            if self._is_token_consumed:
+                self._source.parse()
+                self._is_token_consumed = False
             token = self._source.get_token()
             self._state = router.find_next_state(self._state, token)
             self.process_token(token)
+            if routing_table is not None and not self._ready:
+                self.follow_forced_path(routing_table, token)
+
+    def iter_tokens(self):
+        """
+        Lazily parse the source and yield the tokens of the parser.
+        NOTE: The finish token of the parser is not yielded!
+        :return: a generator of token objects
+        """
+        while not self._finished:
+            self.parse()
+            if self._finished:
+                return
+            yield self._token
+
+    def __iter__(self):
+        return self.iter_tokens()
+
+    def feed(self, data):
+        """
+        Feed a chunk of the input and parse it as far as possible.
+        NOTE: The first source of the parser chain must be a SourceFeed object!
+        :param data: the chunk as a string
+        :return: the list of the completed tokens
+        """
+        self.feed_source(data)
+        return self.collect_available_tokens()
+
+    def close(self):
+        """
+        Sign the end of the input and parse the remaining part of it.
+        :return: the list of the completed tokens
+        """
+        self.close_source()
+        return self.collect_available_tokens()
+
+    def feed_source(self, data):
+        """
+        Feed a chunk to the first source of the parser chain without parsing it.
+        :param data: the chunk as a string
+        :return: None
+        """
+        if isinstance(self._source, Parser):
+            self._source.feed_source(data)
+        else:
+            self._source.feed(data)
+
+    def close_source(self):
+        """Sign the end of the input of the first source of the parser chain."""
+        if isinstance(self._source, Parser):
+            self._source.close_source()
+        else:
+            self._source.close()
+
+    def collect_available_tokens(self):
+        """
+        Parse the tokens until the finish or the end of the available input.
+        :return: the list of the completed tokens
+        """
+        tokens = []
+        try:
+            while not self._finished:
+                self.parse()
+                if self._finished:
+                    break
+                tokens.append(self._token)
+        except InputPending:
+            pass
+        return tokens
+
+    def is_finished(self):
+        """
+        Signs that the parser has reached the finish node of the entry expression.
+        :return: True, when the parsing has finished, else False
+        """
+        return self._finished
+
+    def snapshot(self):
+        """
+        Capture the state of the parsing.
+        NOTE: The stacks are captured by their lengths, because the stack nodes only append to them,
+        and the restore copies their prefixes!
+        :return: the snapshot as a dictionary for the restore method
+        :raises RuntimeError: when the parser runs a generated program
+        """
+        if self._runner is not None:
+            raise RuntimeError('The parser of a generated program can not be snapshotted!')
+        return {
+            'state': self._state,
+            'stacks': {name: (values, len(values)) for name, values in self._stacks.items()},
+            'token': self._token,
+            'consumed': self._is_token_consumed,
+            'ready': self._ready,
+            'finished': self._finished,
+            'source': self._source.snapshot()
+        }
+
+    def restore(self, snapshot):
+        """
+        Restore the state of the parsing.
+        :param snapshot: a snapshot dictionary of the parser
+        :return: None
+        """
+        self._state = snapshot['state']
+        self._stacks = {name: values[:length] for name, (values, length) in snapshot['stacks'].items()}
+        self._token = snapshot['token']
+        self._is_token_consumed = snapshot['consumed']
+        self._ready = snapshot['ready']
+        self._finished = snapshot['finished']
+        self._source.restore(snapshot['source'])
+
+    def follow_forced_path(self, routing_table, token):
+        """
+        Process the nodes which follow the current node without routing decision.
+        :param routing_table: the routing table of the grammar
+        :param token: the current token
+        :return: None
+        """
+        forced_path = routing_table.get_forced_path(self._state.expression_name, self._state.node_id)
+        for node_id in forced_path:
+            self._state = self._state.at_node_id(node_id)
+            self.process_token(token)
+            if self._ready:
+                return
 
     def get_token(self):
         """
@@ -50,13 +258,27 @@ class Parser(object):
         self.parse()
         return self.get_token()
 
+    def get_buffer(self):
+        """
+        The tokens of the parser are not in a buffer.
+        :return: None
+        """
+        return None
+
+    def get_position(self):
+        """
+        The tokens of the parser have no buffer positions.
+        :return: None
+        """
+        return None
+
     def get_finish_token(self):
         """
         Returns with the finish token of the parser.
-        NOTE: It must be implemented when the parser provides tokens as outputs!
+        NOTE: It is the finish token of the sources by default!
         :return: a token object
         """
-        pass
+        return Source.get_finish_token()
 
     def show_info(self, message, token):
         """
@@ -102,8 +324,14 @@ class Parser(object):
         :return: None
         """
         if stack_name not in self._stacks:
-            self._stacks[stack_name] = []
-        self._stacks[stack_name].append(token.value)
+            self._stacks[stack_name] = self.create_stack()
+        stack = self._stacks[stack_name]
+        if isinstance(stack, SpanStack) and token is self._source.get_token():
+            position = self._source.get_position()
+            if position is not None:
+                stack.append_position(position)
+                return
+        stack.append(token.value)
 
     def clean_stack(self, stack_name, token):
         """
@@ -112,7 +340,91 @@ class Parser(object):
         :param token: the current token
         :return: None
         """
-        self._stacks[stack_name] = []
+        self._stacks[stack_name] = self.create_stack()
+
+    def create_stack(self):
+        """
+        Create an empty stack.
+        NOTE: When the use_span_stacks attribute is set, the characters of the source buffer are stored as spans
+        and sliced only when the stack is read!
+        :return: a SpanStack object for span stacks over sources with buffer, else a list
+        """
+        if self.use_span_stacks and self._buffer is not None:
+            return SpanStack(self._buffer)
+        return []
+
+    def get_stack_value(self, stack_name):
+        """
+        Get the concatenation of the values of the stack.
+        NOTE: It is the intended way to read a stack, because it does not slice the spans to characters!
+        :param stack_name: the name of the stack as a string
+        :return: the value as a string, empty for missing stacks
+        """
+        stack = self._stacks.get(stack_name, [])
+        if isinstance(stack, SpanStack):
+            return stack.get_value()
+        return ''.join(stack)
+
+    @classmethod
+    def get_node_handlers(cls):
+        """
+        Get the node handler table of the parser class.
+        NOTE: The table is built once per class from the node_handler_names attribute!
+        :return: dictionary of node types and handler functions
+        """
+        if '_node_handlers' not in cls.__dict__:
+            cls._node_handlers = {
+                node_type: getattr(cls, handler_name)
+                for node_type, handler_name in cls.node_handler_names.items()
+            }
+        return cls._node_handlers
+
+    @classmethod
+    def get_registered_actions(cls):
+        """
+        Get the action handlers which are registered by decorators in the parser class.
+        :return: dictionary of (node_type, name) pairs and handler functions
+        """
+        if '_registered_actions' not in cls.__dict__:
+            attribute_names = {name for klass in cls.__mro__ for name in vars(klass)}
+            registered_actions = {}
+            for attribute_name in sorted(attribute_names):
+                method = getattr(cls, attribute_name, None)
+                for action in getattr(method, 'exprail_actions', []):
+                    registered_actions[action] = method
+            cls._registered_actions = registered_actions
+        return cls._registered_actions
+
+    def bind_action_handler(self, node_type, name):
+        """
+        Bind the handler of the action to the parser.
+        :param node_type: the type of the action node
+        :param name: the value of the action node
+        :return: a callable which receives the token
+        :raises ValueError: when the parser registers handlers for the node type but not for the name
+        """
+        registered_actions = self.get_registered_actions()
+        if (node_type, name) in registered_actions:
+            return functools.partial(registered_actions[(node_type, name)], self)
+        method_name = ACTION_METHOD_NAMES[node_type]
+        is_overridden = getattr(type(self), method_name) is not getattr(Parser, method_name)
+        if not is_overridden and any(action_type is node_type for action_type, _ in registered_actions):
+            raise ValueError('There is no handler for the {} "{}"!'.format(node_type.value, name))
+        return functools.partial(getattr(self, method_name), name)
+
+    def get_action_handler(self, node_type, name):
+        """
+        Get the bound handler of an operation, transformation or stack node.
+        :param node_type: the type of the action node
+        :param name: the value of the action node
+        :return: a callable which receives the token
+        """
+        try:
+            return self._action_handlers[(node_type, name)]
+        except KeyError:
+            handler = self.bind_action_handler(node_type, name)
+            self._action_handlers[(node_type, name)] = handler
+            return handler
 
     def process_token(self, token):
         """
@@ -120,27 +432,47 @@ class Parser(object):
         :param token: a token object
         :return: None
         """
-        node_type = self._state.node.type
-        node_value = self._state.node.value
-        if node_type is NodeType.EXPRESSION:
-            expression_name = self._state.node.value
-            node_id = self._state.grammar.expressions[expression_name].get_start_node_id()
-            self._state = State(self._state.grammar, expression_name, node_id, self._state)
-        elif node_type is NodeType.FINISH:
-            if self._state.return_state is None:
-                self._token = self.get_finish_token()
-                self._ready = True
-        elif node_type is NodeType.INFO:
-            self.show_info(node_value, token)
-        elif node_type is NodeType.ERROR:
-            self.show_error(node_value, token)
-        elif node_type is NodeType.TRANSFORMATION:
-            self._token = self.transform(node_value, token)
-        elif node_type is NodeType.OPERATION:
-            self.operate(node_value, token)
-        elif node_type is NodeType.STACK:
-            self.push_stack(node_value, token)
-        elif node_type is NodeType.CLEAN:
-            self.clean_stack(node_value, token)
-        elif node_type in [NodeType.TOKEN, NodeType.EXCEPT_TOKEN, NodeType.DEFAULT_TOKEN]:
-            self._source.parse()
+        node = self._state.node
+        handler = self._node_handlers.get(node.type)
+        if handler is not None:
+            handler(self, node, token)
+
+    def process_expression_node(self, node, token):
+        """Enter to the expression of the node."""
+        node_id = self._grammar.expressions[node.value].get_start_node_id()
+        self._state = self._grammar.create_state(node.value, node_id, self._state)
+
+    def process_finish_node(self, node, token):
+        """Finish the parsing at the finish node of the entry expression."""
+        if self._state.return_state is None:
+            self._token = self.get_finish_token()
+            self._ready = True
+            self._finished = True
+
+    def process_info_node(self, node, token):
+        """Show the information of the node."""
+        self.show_info(node.value, token)
+
+    def process_error_node(self, node, token):
+        """Show the error of the node."""
+        self.show_error(node.value, token)
+
+    def process_transformation_node(self, node, token):
+        """Transform the token by the transformation of the node."""
+        self._token = self.get_action_handler(NodeType.TRANSFORMATION, node.value)(token)
+
+    def process_operation_node(self, node, token):
+        """Fulfil the operation of the node."""
+        self.get_action_handler(NodeType.OPERATION, node.value)(token)
+
+    def process_stack_node(self, node, token):
+        """Push the token value onto the stack of the node."""
+        self.get_action_handler(NodeType.STACK, node.value)(token)
+
+    def process_clean_node(self, node, token):
+        """Clean the stack of the node."""
+        self.clean_stack(node.value, token)
+
+    def process_token_node(self, node, token):
+        """Consume the token, the next one is parsed from the source when it is requested."""
+        self._is_token_consumed = True
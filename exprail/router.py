@@ -13,6 +13,9 @@ def find_next_state(start_state, token):
     :return: the next state
     :raises RuntimeError: when the next state is missing or unambiguous
     """
+    routing_table = start_state.grammar.routing_table
+    if routing_table is not None:
+        return find_next_state_by_table(routing_table, start_state, token)
     matching_states = set()
     default_states = set()
     for state in start_state.find_successor_states():
@@ -31,6 +34,106 @@ def find_next_state(start_state, token):
         raise RuntimeError('There is no possible next state!')
 
 
+def find_next_state_by_table(routing_table, start_state, token):
+    """
+    Find the next state of the parser by using the precompiled routing table.
+    :param routing_table: the routing table of the grammar
+    :param start_state: the current state of the parser
+    :param token: the currently processed token
+    :return: the next state
+    :raises RuntimeError: when the next state is missing or unambiguous
+    """
+    base_state = get_base_state(start_state)
+    automaton = start_state.grammar.automaton
+    if automaton is not None and token.type == 'char':
+        transition = automaton.find_transition(base_state.expression_name, base_state.node_id, token.value)
+        if transition is not None:
+            is_ground, node_id = transition
+            if is_ground:
+                return find_ground_state(routing_table, start_state)
+            else:
+                return base_state.at_node_id(node_id)
+    token_classes = routing_table.get_token_classes(base_state.expression_name, base_state.node_id)
+    if token_classes:
+        matching_classes = start_state.grammar.classifier.is_in_classes(token_classes, token)
+    else:
+        matching_classes = token_classes
+    candidates = routing_table.get_candidates(base_state.expression_name, base_state.node_id)
+    if start_state.grammar.is_trusted():
+        matching_node_id = find_first_matching_node_id(candidates, matching_classes)
+        if matching_node_id is not None:
+            return base_state.at_node_id(matching_node_id)
+    else:
+        n_matching_states = 0
+        matching_node_id = None
+        for node_id, matchers, _ in candidates:
+            n_matching_successors = 0
+            for is_except, token_class in matchers:
+                if (token_class in matching_classes) is not is_except:
+                    n_matching_successors += 1
+            if n_matching_successors == 1:
+                n_matching_states += 1
+                matching_node_id = node_id
+            elif n_matching_successors > 1:
+                raise RuntimeError('There are multiple matching successors!')
+        if n_matching_states == 1:
+            return base_state.at_node_id(matching_node_id)
+    default_node_id = routing_table.get_default_node_id(base_state.expression_name, base_state.node_id)
+    if default_node_id is not None:
+        return base_state.at_node_id(default_node_id)
+    return find_ground_state(routing_table, start_state)
+
+
+def find_ground_state(routing_table, start_state):
+    """
+    Find the ground state in the expression of the start state.
+    :param routing_table: the routing table of the grammar
+    :param start_state: the current state of the parser
+    :return: the state of the ground node
+    :raises RuntimeError: when the expression has no ground node
+    """
+    ground_node_id = routing_table.get_ground_node_id(start_state.expression_name)
+    if ground_node_id is not None:
+        return start_state.at_node_id(ground_node_id)
+    else:
+        raise RuntimeError('There is no possible next state!')
+
+
+def find_first_matching_node_id(candidates, matching_classes):
+    """
+    Find the first candidate which has a matching successor.
+    NOTE: It is valid only for grammars which have no ambiguous routes!
+    :param candidates: the routing candidates of the base state
+    :param matching_classes: the set of token classes which contain the token
+    :return: the identifier of the candidate node or None, when there is no matching candidate
+    """
+    for node_id, matchers, _ in candidates:
+        for is_except, token_class in matchers:
+            if (token_class in matching_classes) is not is_except:
+                return node_id
+    return None
+
+
+def get_base_state(start_state):
+    """
+    Get the state whose targets are the successors of the start state.
+    :param start_state: the current state of the parser
+    :return: a state object
+    :raises RuntimeError: when the start state is a top level finish node
+    """
+    node_type = start_state.node.type
+    if node_type is NodeType.FINISH:
+        if start_state.return_state is None:
+            raise RuntimeError('The top level expression finish nodes have no successors!')
+        return start_state.return_state
+    elif node_type is NodeType.EXPRESSION:
+        expression_name = start_state.node.value
+        node_id = start_state.grammar.expressions[expression_name].get_start_node_id()
+        return start_state.grammar.create_state(expression_name, node_id, start_state)
+    else:
+        return start_state
+
+
 def has_matching_successor(state, token):
     """
     Check that is there any matching successor state.
@@ -39,14 +142,18 @@ def has_matching_successor(state, token):
     :return: True, when there is a matching successor, else False
     :raises RuntimeError: when there are multiple matching successors
     """
-    classifier = state.grammar.classifier
+    if not may_have_matching_successor(state, token):
+        return False
+    successors = collect_matchable_successors(state)
+    token_classes = {successor.node.value for successor in successors}
+    matching_classes = state.grammar.classifier.is_in_classes(token_classes, token)
     n_matching_successors = 0
-    for successor in collect_matchable_successors(state):
+    for successor in successors:
         if successor.node.type in [NodeType.ROUTER, NodeType.TOKEN]:
-            if classifier.is_in_class(successor.node.value, token):
+            if successor.node.value in matching_classes:
                 n_matching_successors += 1
         elif successor.node.type in [NodeType.EXCEPT_ROUTER, NodeType.EXCEPT_TOKEN]:
-            if not classifier.is_in_class(successor.node.value, token):
+            if successor.node.value not in matching_classes:
                 n_matching_successors += 1
     if n_matching_successors == 0:
         return False
@@ -56,6 +163,25 @@ def has_matching_successor(state, token):
         raise RuntimeError('There are multiple matching successors!')
 
 
+def may_have_matching_successor(state, token):
+    """
+    Check the FIRST set of the state before walking into the successors and the called expressions.
+    :param state: the start state of the searching
+    :param token: the token which should be matched
+    :return: False, when none of the first matchable nodes can match, else True
+    """
+    first_set = state.grammar.get_first_set(state.expression_name, state.node_id)
+    if not first_set:
+        return False
+    token_classes = {node.value for node in first_set}
+    matching_classes = state.grammar.classifier.is_in_classes(token_classes, token)
+    for node in first_set:
+        is_except = node.type in [NodeType.EXCEPT_ROUTER, NodeType.EXCEPT_TOKEN]
+        if (node.value in matching_classes) is not is_except:
+            return True
+    return False
+
+
 def has_default_successor(start_state):
     """
     Check that is there any default successor state.
@@ -0,0 +1,188 @@
+"""
+Functions for the compact binary serialization of the grammar expressions and routing tables.
+"""
+
+import struct
+
+from exprail.expression import Expression
+from exprail.node import Node, NodeType
+from exprail.table import RoutingTable
+
+MAGIC = b'EXPRAIL'
+VERSION = 2
+
+HEADER = struct.Struct('<7sBII')
+LENGTH = struct.Struct('<I')
+
+NODE_TYPES = list(NodeType)
+
+
+def dump_grammar(expressions, routing_table=None):
+    """
+    Serialize the expressions and the compiled routing table to flat arrays.
+    NOTE: The layout is a little-endian header of the magic, the version, the number of strings and the number of
+    integers, followed by the length prefixed UTF-8 strings and the signed 32-bit integers, so it does not depend on
+    the Python version! The strings are stored once and referenced by their indices from the integers.
+    :param expressions: dictionary of expression names and expression objects
+    :param routing_table: the routing table of the expressions or None
+    :return: the serialized grammar as bytes
+    """
+    strings = {}
+    integers = []
+    type_codes = {node_type: code for code, node_type in enumerate(NODE_TYPES)}
+    integers.append(len(NODE_TYPES))
+    integers.extend(strings.setdefault(node_type.value, len(strings)) for node_type in NODE_TYPES)
+    integers.append(len(expressions))
+    for expression_name, expression in expressions.items():
+        index = expression.get_index()
+        integers.extend((strings.setdefault(expression_name, len(strings)), -1 if index is None else index))
+        node_ids = sorted(expression.nodes)
+        integers.append(len(node_ids))
+        edges = []
+        for node_id in node_ids:
+            node = expression.nodes[node_id]
+            integers.extend((node_id, type_codes[node.type], strings.setdefault(node.value, len(strings))))
+            for target_id in sorted(expression.get_target_node_ids(node_id)):
+                edges.extend((node_id, target_id))
+        integers.append(len(edges) // 2)
+        integers.extend(edges)
+    integers.append(int(routing_table is not None))
+    if routing_table is not None:
+        for expression_name, expression in expressions.items():
+            append_optional(integers, routing_table.get_ground_node_id(expression_name))
+            for node_id in sorted(expression.nodes):
+                append_optional(integers, routing_table.get_default_node_id(expression_name, node_id))
+                candidates = routing_table.get_candidates(expression_name, node_id)
+                integers.append(len(candidates))
+                for target_id, matchers, is_default in candidates:
+                    integers.extend((target_id, int(is_default), len(matchers)))
+                    for is_except, token_class in matchers:
+                        integers.extend((int(is_except), strings.setdefault(token_class, len(strings))))
+                forced_path = routing_table.get_forced_path(expression_name, node_id)
+                integers.append(len(forced_path))
+                integers.extend(forced_path)
+    parts = [HEADER.pack(MAGIC, VERSION, len(strings), len(integers))]
+    for string in strings:
+        encoded = string.encode('utf-8')
+        parts.append(LENGTH.pack(len(encoded)))
+        parts.append(encoded)
+    parts.append(struct.pack('<{}i'.format(len(integers)), *integers))
+    return b''.join(parts)
+
+
+def append_optional(integers, value):
+    """
+    Append an optional integer as a presence flag and a value.
+    :param integers: the list of the serialized integers
+    :param value: an integer or None
+    :return: None
+    """
+    if value is None:
+        integers.extend((0, 0))
+    else:
+        integers.extend((1, value))
+
+
+def load_grammar(data):
+    """
+    Deserialize the expressions and the compiled routing table from flat arrays.
+    :param data: the serialized grammar as bytes
+    :return: dictionary of expression names and expression objects, and the routing table or None
+    :raises ValueError: when the data is not a serialized grammar of the current version
+    """
+    try:
+        magic, version, n_strings, n_integers = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('Invalid serialized grammar!')
+        offset = HEADER.size
+        strings = []
+        for _ in range(n_strings):
+            length, = LENGTH.unpack_from(data, offset)
+            offset += LENGTH.size
+            strings.append(data[offset:offset + length].decode('utf-8'))
+            offset += length
+        integer_format = '<{}i'.format(n_integers)
+        if len(data) != offset + struct.calcsize(integer_format):
+            raise ValueError('Invalid serialized grammar!')
+        integers = iter(struct.unpack_from(integer_format, data, offset))
+        expressions, node_ids = load_expressions(integers, strings)
+        routing_table = None
+        if next(integers):
+            routing_table = load_routing_table(integers, strings, node_ids)
+        if next(integers, None) is not None:
+            raise ValueError('Invalid serialized grammar!')
+    except (struct.error, UnicodeDecodeError, StopIteration, IndexError):
+        raise ValueError('Invalid serialized grammar!')
+    return expressions, routing_table
+
+
+def load_expressions(integers, strings):
+    """
+    Load the expressions from the serialized integers.
+    :param integers: the iterator of the serialized integers
+    :param strings: the list of the serialized strings
+    :return: dictionary of expression names and expression objects, and the list of the sorted node identifiers
+    """
+    node_types = [NodeType(strings[next(integers)]) for _ in range(next(integers))]
+    nodes = {}
+    expressions = {}
+    node_ids = []
+    for _ in range(next(integers)):
+        name_index = next(integers)
+        index = next(integers)
+        expression = Expression(None if index < 0 else index)
+        expression_node_ids = []
+        for _ in range(next(integers)):
+            node_id = next(integers)
+            key = (next(integers), next(integers))
+            if key not in nodes:
+                nodes[key] = Node(node_types[key[0]], strings[key[1]])
+            expression.add_node(node_id, nodes[key])
+            expression_node_ids.append(node_id)
+        for _ in range(next(integers)):
+            expression.add_edge(next(integers), next(integers))
+        expressions[strings[name_index]] = expression
+        node_ids.append((strings[name_index], expression_node_ids))
+    return expressions, node_ids
+
+
+def load_routing_table(integers, strings, node_ids):
+    """
+    Load the compiled routing table from the serialized integers.
+    :param integers: the iterator of the serialized integers
+    :param strings: the list of the serialized strings
+    :param node_ids: list of expression names and their sorted node identifiers
+    :return: a RoutingTable object
+    """
+    candidates = {}
+    default_node_ids = {}
+    ground_node_ids = {}
+    forced_paths = {}
+    for expression_name, expression_node_ids in node_ids:
+        ground_node_ids[expression_name] = load_optional(integers)
+        for node_id in expression_node_ids:
+            default_node_id = load_optional(integers)
+            if default_node_id is not None:
+                default_node_ids[(expression_name, node_id)] = default_node_id
+            node_candidates = []
+            for _ in range(next(integers)):
+                target_id = next(integers)
+                is_default = bool(next(integers))
+                matchers = tuple([(bool(next(integers)), strings[next(integers)]) for _ in range(next(integers))])
+                node_candidates.append((target_id, matchers, is_default))
+            candidates[(expression_name, node_id)] = tuple(node_candidates)
+            forced_path = tuple([next(integers) for _ in range(next(integers))])
+            if forced_path:
+                forced_paths[(expression_name, node_id)] = forced_path
+    return RoutingTable.restore(candidates, default_node_ids, ground_node_ids, forced_paths)
+
+
+def load_optional(integers):
+    """
+    Load an optional integer from its presence flag and value.
+    :param integers: the iterator of the serialized integers
+    :return: an integer or None
+    """
+    is_present = next(integers)
+    value = next(integers)
+    return value if is_present else None
@@ -2,7 +2,13 @@
 Source class definition
 """
 
-from exprail.token import Token
+from exprail.token import Token, get_char_token
+
+FINISH_TOKEN = Token('empty', '')
+
+
+class InputPending(Exception):
+    """Signs that the source has no available input yet"""
 
 
 class Source(object):
@@ -15,13 +21,42 @@ class Source(object):
 
     @staticmethod
     def get_finish_token():
-        """Provides the finish token."""
-        return Token('empty', '')
+        """Provides the shared finish token."""
+        return FINISH_TOKEN
 
     def get_token(self):
         """Get the last token of the source."""
         return self._token
 
+    def get_buffer(self):
+        """
+        Get the string which contains the whole input of the source.
+        :return: the buffer as a string or None, when the source has no buffer
+        """
+        return None
+
+    def get_position(self):
+        """
+        Get the position of the current token in the buffer of the source.
+        :return: the index of the character or None
+        """
+        return None
+
+    def snapshot(self):
+        """
+        Capture the position of the source.
+        :return: the snapshot object for the restore method
+        """
+        raise NotImplementedError('The snapshot of the source does not implemented!')
+
+    def restore(self, snapshot):
+        """
+        Restore the position of the source.
+        :param snapshot: a snapshot object of the source
+        :return: None
+        """
+        raise NotImplementedError('The restore of the source does not implemented!')
+
 
 class SourceString(Source):
     """Character parser for input stream with source string"""
@@ -35,10 +70,28 @@ class SourceString(Source):
     def parse(self):
         """Select the next available character."""
         if self._index < len(self._input):
-            self._token = Token('char', self._input[self._index])
+            self._token = get_char_token(self._input[self._index])
             self._index += 1
         else:
-            self._token = Source.get_finish_token()
+            self._token = FINISH_TOKEN
+
+    def get_buffer(self):
+        """Get the source string."""
+        return self._input
+
+    def get_position(self):
+        """Get the index of the current character or None after the end of the string."""
+        if self._token.type == 'char':
+            return self._index - 1
+        return None
+
+    def snapshot(self):
+        """Capture the index and the current token of the source."""
+        return self._index, self._token
+
+    def restore(self, snapshot):
+        """Restore the index and the current token of the source."""
+        self._index, self._token = snapshot
 
 
 class SourceFile(Source):
@@ -54,9 +107,104 @@ class SourceFile(Source):
         if self._input is not None:
             c = self._input.read(1)
             if c:
-                self._token = Token('char', c)
+                self._token = get_char_token(c)
             else:
-                self._token = Source.get_finish_token()
+                self._token = FINISH_TOKEN
                 self._input.close()
                 self._input = None
         self._ready = True
+
+    def snapshot(self):
+        """
+        Capture the file position and the current token of the source.
+        NOTE: The position is None after the end of the file, because the file has been closed!
+        """
+        if self._input is not None:
+            return self._input.tell(), self._token
+        return None, self._token
+
+    def restore(self, snapshot):
+        """
+        Restore the file position and the current token of the source.
+        :raises ValueError: when the file has been closed after the snapshot
+        """
+        position, self._token = snapshot
+        if position is not None:
+            if self._input is None:
+                raise ValueError('The source file has been closed after the snapshot!')
+            self._input.seek(position)
+
+
+class SourceFeed(Source):
+    """Character parser for input stream which is fed by chunks"""
+
+    def __init__(self):
+        """Initialize the empty input buffer."""
+        super(SourceFeed, self).__init__()
+        self._buffer = ''
+        self._offset = 0
+        self._index = 0
+        self._is_closed = False
+        self._is_consumed = True
+
+    def feed(self, data):
+        """
+        Append a chunk to the input buffer.
+        :param data: the chunk as a string
+        :return: None
+        :raises ValueError: when the source has been closed
+        """
+        if self._is_closed:
+            raise ValueError('The source has been closed!')
+        self._offset += self._index
+        self._buffer = self._buffer[self._index:] + data
+        self._index = 0
+
+    def close(self):
+        """Sign the end of the input."""
+        self._is_closed = True
+
+    def is_closed(self):
+        """Signs that the end of the input has been signed."""
+        return self._is_closed
+
+    def parse(self):
+        """
+        Consume the current character.
+        NOTE: The next character is selected only when the token is requested!
+        """
+        self._is_consumed = True
+
+    def get_token(self):
+        """
+        Get the last token of the source.
+        :return: a token object
+        :raises InputPending: when the input buffer has been consumed before the end of the input
+        """
+        if self._is_consumed:
+            if self._index < len(self._buffer):
+                self._token = get_char_token(self._buffer[self._index])
+                self._index += 1
+            elif self._is_closed:
+                self._token = FINISH_TOKEN
+            else:
+                raise InputPending('The source is waiting for input!')
+            self._is_consumed = False
+        return self._token
+
+    def snapshot(self):
+        """Capture the input position and the current token of the source."""
+        return self._offset + self._index, self._token, self._is_consumed
+
+    def restore(self, snapshot):
+        """
+        Restore the input position and the current token of the source.
+        NOTE: The consumed input is dropped from the buffer on feeding, so the snapshot is valid until the next feed!
+        :raises ValueError: when the position has been dropped from the buffer
+        """
+        position, token, is_consumed = snapshot
+        if position < self._offset:
+            raise ValueError('The position of the snapshot has been dropped from the buffer!')
+        self._index = position - self._offset
+        self._token = token
+        self._is_consumed = is_consumed
@@ -0,0 +1,239 @@
+"""
+SpanStack class definition
+"""
+
+import bisect
+
+
+class SpanStack(object):
+    """Stack of values which stores the consecutive characters of the source buffer as spans"""
+
+    __hash__ = None
+
+    def __init__(self, buffer):
+        """
+        Initialize the empty stack.
+        NOTE: The parts are spans as (start, end) pairs or single values, and the ends are their cumulative lengths!
+        :param buffer: the string of the source
+        """
+        self._buffer = buffer
+        self._parts = []
+        self._ends = []
+
+    def __repr__(self):
+        return '<SpanStack({})>'.format(repr(self.get_value()))
+
+    def __len__(self):
+        return self._ends[-1] if self._ends else 0
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __eq__(self, other):
+        if isinstance(other, SpanStack):
+            return self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            if key.start is None and key.step is None and key.stop is not None and key.stop >= 0:
+                return self.copy(key.stop)
+            return self.to_list()[key]
+        part_index, offset = self._locate(key)
+        part = self._parts[part_index]
+        if isinstance(part, tuple):
+            return self._buffer[part[0] + offset]
+        return part
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            values = self.to_list()
+            values[key] = value
+            self._reset(values)
+            return
+        index = self._normalize(key)
+        part_index = self._split(index)
+        self._split(index + 1)
+        self._parts[part_index] = value
+
+    def __delitem__(self, key):
+        if isinstance(key, slice):
+            values = self.to_list()
+            del values[key]
+            self._reset(values)
+        else:
+            self.pop(key)
+
+    def append(self, value):
+        """
+        Push a value which is not in the source buffer.
+        :param value: the value as a string
+        :return: None
+        """
+        self._ends.append(len(self) + 1)
+        self._parts.append(value)
+
+    def append_position(self, position):
+        """
+        Push the character of the source buffer at the given position.
+        :param position: the index of the character in the buffer
+        :return: None
+        """
+        if self._parts and isinstance(self._parts[-1], tuple) and self._parts[-1][1] == position:
+            self._parts[-1] = (self._parts[-1][0], position + 1)
+            self._ends[-1] += 1
+        else:
+            self._ends.append(len(self) + 1)
+            self._parts.append((position, position + 1))
+
+    def extend(self, values):
+        """
+        Push the values which are not in the source buffer.
+        :param values: an iterable of strings
+        :return: None
+        """
+        for value in values:
+            self.append(value)
+
+    def insert(self, index, value):
+        """
+        Insert a value before the given index as the list does.
+        :param index: the index of the value
+        :param value: the value as a string
+        :return: None
+        """
+        length = len(self)
+        if index < 0:
+            index = max(index + length, 0)
+        part_index = self._split(min(index, length))
+        self._parts.insert(part_index, value)
+        self._update_ends(part_index)
+
+    def pop(self, index=-1):
+        """
+        Remove the value at the given index.
+        :param index: the index of the value, the last one by default
+        :return: the removed value
+        :raises IndexError: when the stack is empty or the index is out of range
+        """
+        index = self._normalize(index)
+        value = self[index]
+        part_index = self._split(index)
+        self._split(index + 1)
+        del self._parts[part_index]
+        self._update_ends(part_index)
+        return value
+
+    def clear(self):
+        """Remove all values from the stack."""
+        self._parts = []
+        self._ends = []
+
+    def copy(self, length=None):
+        """
+        Copy the first values of the stack.
+        :param length: the number of the copied values or None for all values
+        :return: a new SpanStack object
+        """
+        if length is None or length > len(self):
+            length = len(self)
+        stack = SpanStack(self._buffer)
+        if length > 0:
+            part_index = bisect.bisect_left(self._ends, length)
+            stack._parts = self._parts[:part_index + 1]
+            stack._ends = self._ends[:part_index + 1]
+            excess = stack._ends[-1] - length
+            if excess:
+                start, end = stack._parts[-1]
+                stack._parts[-1] = (start, end - excess)
+                stack._ends[-1] = length
+        return stack
+
+    def to_list(self):
+        """
+        Get the values as a list.
+        :return: list of strings
+        """
+        values = []
+        for part in self._parts:
+            if isinstance(part, tuple):
+                values.extend(self._buffer[part[0]:part[1]])
+            else:
+                values.append(part)
+        return values
+
+    def get_value(self):
+        """
+        Get the concatenation of the values.
+        NOTE: The spans are sliced from the buffer only at this point!
+        :return: the value as a string
+        """
+        if len(self._parts) == 1 and isinstance(self._parts[0], tuple):
+            return self._buffer[self._parts[0][0]:self._parts[0][1]]
+        return ''.join(self._buffer[part[0]:part[1]] if isinstance(part, tuple) else part for part in self._parts)
+
+    def _normalize(self, index):
+        """
+        Convert the index to a non-negative one.
+        :param index: the index of a value
+        :return: the non-negative index
+        :raises IndexError: when the index is out of range
+        """
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('stack index out of range')
+        return index
+
+    def _locate(self, index):
+        """
+        Find the part of the value by bisecting the cumulative lengths.
+        :param index: the index of the value
+        :return: the index of the part and the offset of the value in the part
+        :raises IndexError: when the index is out of range
+        """
+        index = self._normalize(index)
+        part_index = bisect.bisect_right(self._ends, index)
+        if part_index > 0:
+            index -= self._ends[part_index - 1]
+        return part_index, index
+
+    def _split(self, index):
+        """
+        Split the span of the value at the index, so that the value starts a part.
+        :param index: the index of the value or the length of the stack
+        :return: the index of the part which starts with the value
+        """
+        if index == len(self):
+            return len(self._parts)
+        part_index, offset = self._locate(index)
+        if offset > 0:
+            start, end = self._parts[part_index]
+            self._parts[part_index:part_index + 1] = [(start, start + offset), (start + offset, end)]
+            self._ends.insert(part_index, self._ends[part_index] - (end - start - offset))
+            part_index += 1
+        return part_index
+
+    def _update_ends(self, part_index):
+        """
+        Recount the cumulative lengths from the given part.
+        :param part_index: the index of the first changed part
+        :return: None
+        """
+        del self._ends[part_index:]
+        length = self._ends[-1] if self._ends else 0
+        for part in self._parts[part_index:]:
+            length += part[1] - part[0] if isinstance(part, tuple) else 1
+            self._ends.append(length)
+
+    def _reset(self, values):
+        """
+        Replace the parts with single values.
+        :param values: list of strings
+        :return: None
+        """
+        self._parts = list(values)
+        self._ends = list(range(1, len(values) + 1))
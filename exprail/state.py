@@ -17,6 +17,7 @@ class State(object):
         self._expression_name = expression_name
         self._node_id = node_id
         self._return_state = return_state
+        self._hash = hash((expression_name, node_id, return_state))
 
     def __repr__(self):
         if self._return_state is None:
@@ -27,6 +28,8 @@ class State(object):
 
     def __eq__(self, other):
         # NOTE: It does not consider the grammar object!
+        if self is other:
+            return True
         conditions = [
             self._expression_name == other.expression_name,
             self._node_id == other.node_id,
@@ -36,7 +39,7 @@ class State(object):
 
     def __hash__(self):
         # NOTE: It does not consider the grammar object!
-        return hash((self._expression_name, self._node_id, self._return_state))
+        return self._hash
 
     @property
     def grammar(self):
@@ -68,26 +71,39 @@ class State(object):
         :param node_id: an other node identifier of the expression
         :return: a state object
         """
-        return State(self._grammar, self._expression_name, node_id, self._return_state)
+        return self._grammar.create_state(self._expression_name, node_id, self._return_state)
 
     def find_successor_states(self):
         """
         Find the successor states of the given state.
-        :return: the set of successor states
+        NOTE: The result is shared when the successor cache of the grammar is enabled, so it is always immutable!
+        :return: the frozenset of successor states
+        """
+        successor_cache = self._grammar.successor_cache
+        if successor_cache is None:
+            return self.collect_successor_states()
+        successor_states = successor_cache.get(self)
+        if successor_states is None:
+            successor_states = self.collect_successor_states()
+            successor_cache.put(self, successor_states)
+        return successor_states
+
+    def collect_successor_states(self):
+        """
+        Collect the successor states of the given state from the expression graphs.
+        :return: the frozenset of successor states
         """
         if self.node.type is NodeType.EXPRESSION:
             expression_name = self.node.value
             node_id = self._grammar.expressions[expression_name].get_start_node_id()
-            start_state = State(self._grammar, expression_name, node_id, self)
-            return start_state.find_successor_states()
+            start_state = self._grammar.create_state(expression_name, node_id, self)
+            return start_state.collect_successor_states()
         elif self.node.type is NodeType.FINISH:
             if self._return_state is not None:
                 target_node_ids = self.return_state.expression.get_target_node_ids(self.return_state.node_id)
-                successor_states = {self.return_state.at_node_id(node_id) for node_id in target_node_ids}
-                return successor_states
+                return frozenset(self.return_state.at_node_id(node_id) for node_id in target_node_ids)
             else:
                 raise RuntimeError('The top level expression finish nodes have no successors!')
         else:
             target_node_ids = self.expression.get_target_node_ids(self.node_id)
-            successor_states = {self.at_node_id(node_id) for node_id in target_node_ids}
-            return successor_states
+            return frozenset(self.at_node_id(node_id) for node_id in target_node_ids)
@@ -0,0 +1,160 @@
+"""
+RoutingTable class definition
+"""
+
+from exprail.node import NodeType
+from exprail import router
+from exprail.state import State
+
+PASS_THROUGH_NODE_TYPES = {
+    NodeType.CONNECTION,
+    NodeType.INFO,
+    NodeType.ERROR,
+    NodeType.OPERATION,
+    NodeType.TRANSFORMATION,
+    NodeType.STACK,
+    NodeType.CLEAN
+}
+
+
+class RoutingTable(object):
+    """Represents the precompiled routing information of a grammar."""
+
+    def __init__(self, grammar):
+        """
+        Compile the routing table of the grammar.
+        :param grammar: a validated grammar object
+        """
+        self._candidates = {}
+        self._token_classes = {}
+        self._default_node_ids = {}
+        self._forced_paths = {}
+        self._ground_node_ids = {}
+        successors = {}
+        for expression_name, expression in grammar.expressions.items():
+            if expression.has_ground_node():
+                self._ground_node_ids[expression_name] = expression.get_ground_node_id()
+            else:
+                self._ground_node_ids[expression_name] = None
+            for node_id in expression.nodes:
+                candidates = []
+                for target_id in sorted(expression.get_target_node_ids(node_id)):
+                    key = (expression_name, target_id)
+                    if key not in successors:
+                        successors[key] = RoutingTable.collect_successor_info(grammar, expression_name, target_id)
+                    matchers, is_default = successors[key]
+                    candidates.append((target_id, matchers, is_default))
+                self._candidates[(expression_name, node_id)] = tuple(candidates)
+                token_classes = {token_class for _, matchers, _ in candidates for _, token_class in matchers}
+                self._token_classes[(expression_name, node_id)] = frozenset(token_classes)
+                default_node_ids = [target_id for target_id, _, is_default in candidates if is_default]
+                if len(default_node_ids) == 1:
+                    self._default_node_ids[(expression_name, node_id)] = default_node_ids[0]
+                forced_path = RoutingTable.collect_forced_path(expression, node_id)
+                if forced_path:
+                    self._forced_paths[(expression_name, node_id)] = forced_path
+
+    @classmethod
+    def restore(cls, candidates, default_node_ids, ground_node_ids, forced_paths):
+        """
+        Restore a compiled routing table without walking the grammar.
+        NOTE: The token classes are derived from the matchers of the candidates!
+        :param candidates: dictionary of (expression_name, node_id) keys and candidate tuples
+        :param default_node_ids: dictionary of (expression_name, node_id) keys and default node identifiers
+        :param ground_node_ids: dictionary of expression names and ground node identifiers or None
+        :param forced_paths: dictionary of (expression_name, node_id) keys and non-empty forced paths
+        :return: a RoutingTable object
+        """
+        routing_table = cls.__new__(cls)
+        routing_table._candidates = candidates
+        routing_table._token_classes = {
+            key: frozenset(token_class for _, matchers, _ in node_candidates for _, token_class in matchers)
+            for key, node_candidates in candidates.items()
+        }
+        routing_table._default_node_ids = default_node_ids
+        routing_table._forced_paths = forced_paths
+        routing_table._ground_node_ids = ground_node_ids
+        return routing_table
+
+    @staticmethod
+    def collect_successor_info(grammar, expression_name, node_id):
+        """
+        Collect the routing information of a successor node.
+        :param grammar: the grammar object
+        :param expression_name: the name of the expression of the successor
+        :param node_id: the identifier of the successor node
+        :return: the tuple of (is_except, token_class) matchers and the default flag
+        """
+        state = State(grammar, expression_name, node_id)
+        matchers = []
+        for successor in router.collect_matchable_successors(state):
+            is_except = successor.node.type in [NodeType.EXCEPT_ROUTER, NodeType.EXCEPT_TOKEN]
+            matchers.append((is_except, successor.node.value))
+        return tuple(sorted(matchers)), router.has_default_successor(state)
+
+    @staticmethod
+    def collect_forced_path(expression, node_id):
+        """
+        Collect the nodes which follow the node without routing decision.
+        NOTE: A non-consuming node with only one target has the same matching and default successors as its target,
+        so the target is selected by the router whenever the node has been selected!
+        :param expression: the expression object
+        :param node_id: the identifier of the node which has been selected by the router
+        :return: the tuple of the node identifiers in the order of processing
+        """
+        forced_path = []
+        visited_node_ids = {node_id}
+        while expression.nodes[node_id].type in PASS_THROUGH_NODE_TYPES:
+            target_node_ids = expression.get_target_node_ids(node_id)
+            if len(target_node_ids) != 1:
+                break
+            node_id = next(iter(target_node_ids))
+            if node_id in visited_node_ids:
+                break
+            forced_path.append(node_id)
+            visited_node_ids.add(node_id)
+        return tuple(forced_path)
+
+    def get_forced_path(self, expression_name, node_id):
+        """
+        Get the nodes which follow the selected node without routing decision.
+        :param expression_name: the name of the expression
+        :param node_id: the identifier of the selected node
+        :return: the tuple of node identifiers
+        """
+        return self._forced_paths.get((expression_name, node_id), ())
+
+    def get_candidates(self, expression_name, node_id):
+        """
+        Get the routing candidates which follow the given node.
+        :param expression_name: the name of the expression
+        :param node_id: the identifier of the node
+        :return: the tuple of (target_id, matchers, is_default) candidates
+        """
+        return self._candidates[(expression_name, node_id)]
+
+    def get_token_classes(self, expression_name, node_id):
+        """
+        Get the token classes which are considered in the routing from the given node.
+        :param expression_name: the name of the expression
+        :param node_id: the identifier of the node
+        :return: the frozenset of token class names
+        """
+        return self._token_classes[(expression_name, node_id)]
+
+    def get_default_node_id(self, expression_name, node_id):
+        """
+        Get the default route from the given node.
+        :param expression_name: the name of the expression
+        :param node_id: the identifier of the node
+        :return: the identifier of the only default candidate or None, when it is missing or ambiguous
+        """
+        return self._default_node_ids.get((expression_name, node_id))
+
+    def get_ground_node_id(self, expression_name):
+        """
+        Get the identifier of the ground node of the expression.
+        :param expression_name: the name of the expression
+        :return: the ground node identifier or None, when the expression has no ground node
+        """
+        return self._ground_node_ids[expression_name]
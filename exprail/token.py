@@ -4,7 +4,9 @@ Token class definition
 
 
 class Token(object):
-    """Represents a token with type and value"""
+    """Represents an immutable token with type and value"""
+
+    __slots__ = ('_type', '_value')
 
     def __init__(self, type, value):
         self._type = type
@@ -17,3 +19,35 @@ class Token(object):
     @property
     def value(self):
         return self._value
+
+    def __repr__(self):
+        return '<Token({}, {})>'.format(repr(self._type), repr(self._value))
+
+    def __eq__(self, other):
+        if not isinstance(other, Token):
+            return NotImplemented
+        return self._type == other.type and self._value == other.value
+
+    def __hash__(self):
+        return hash((self._type, self._value))
+
+
+MAX_CHAR_TOKENS = 4096
+
+CHAR_TOKENS = {chr(code): Token('char', chr(code)) for code in range(128)}
+
+
+def get_char_token(char):
+    """
+    Get the shared token of the character.
+    NOTE: The ASCII tokens are prebuilt, the others are cached until the number of tokens reaches the limit!
+    :param char: the character as a string
+    :return: a token object with 'char' type
+    """
+    try:
+        return CHAR_TOKENS[char]
+    except KeyError:
+        token = Token('char', char)
+        if len(CHAR_TOKENS) < MAX_CHAR_TOKENS:
+            CHAR_TOKENS[char] = token
+        return token
@@ -147,3 +147,45 @@ def validate_grammar(grammar):
     for _, expression in grammar.expressions.items():
         validate_expression(expression)
     check_referenced_expressions(grammar)
+
+
+def may_overlap(classifier, matcher, other_matcher):
+    """
+    Check that two matchers may accept the same token.
+    :param classifier: the classifier of the grammar
+    :param matcher: an (is_except, token_class) pair
+    :param other_matcher: an other (is_except, token_class) pair
+    :return: False, when the matchers are provably disjoint, else True
+    """
+    is_except, token_class = matcher
+    other_is_except, other_token_class = other_matcher
+    if is_except and other_is_except:
+        return True
+    elif is_except or other_is_except:
+        return token_class != other_token_class
+    else:
+        return not classifier.are_disjoint(token_class, other_token_class)
+
+
+def find_ambiguous_nodes(grammar):
+    """
+    Find the nodes where more than one successor may match the same token.
+    NOTE: The matchers of a successor are the first matchable nodes which can be reached from it!
+    :param grammar: a compiled grammar object with classifier
+    :return: the list of (expression_name, node_id) pairs of the ambiguous nodes
+    :raises ValueError: when the grammar has not compiled or it has no classifier
+    """
+    if grammar.routing_table is None or grammar.classifier is None:
+        raise ValueError('The ambiguity check requires a compiled grammar with classifier!')
+    ambiguous_nodes = []
+    for expression_name in sorted(grammar.expressions):
+        for node_id in sorted(grammar.expressions[expression_name].nodes):
+            candidates = grammar.routing_table.get_candidates(expression_name, node_id)
+            matchers = [matcher for _, candidate_matchers, _ in candidates for matcher in candidate_matchers]
+            is_ambiguous = any(
+                may_overlap(grammar.classifier, matchers[i], matchers[j])
+                for i in range(len(matchers)) for j in range(i + 1, len(matchers))
+            )
+            if is_ambiguous:
+                ambiguous_nodes.append((expression_name, node_id))
+    return ambiguous_nodes
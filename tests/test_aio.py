@@ -0,0 +1,66 @@
+import asyncio
+import string
+import unittest
+
+from exprail.aio import AsyncParser
+from exprail.classifier import CharClassClassifier
+from exprail.grammar import Grammar
+from exprail.parser import Parser
+from exprail.token import Token
+
+
+class WordTokenizer(Parser):
+    """Provide the words of the source as tokens"""
+
+    def operate(self, operation, token):
+        """Provide the collected word."""
+        self._token = Token('word', self.get_stack_value(''))
+        self._ready = True
+
+
+class ChunkReader(object):
+    """Provide the chunks of the input and count the reads"""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+        self.n_reads = 0
+
+    async def read(self, n):
+        self.n_reads += 1
+        await asyncio.sleep(0)
+        if self._chunks:
+            return self._chunks.pop(0)
+        return b''
+
+
+class AsyncParserTest(unittest.TestCase):
+    """Unittest for the AsyncParser class"""
+
+    def setUp(self):
+        classifier = CharClassClassifier(char_classes={'ws': ' ', 'a-Z': string.ascii_letters + 'é'})
+        self._grammar = Grammar('grammars/words.grammar', classifier=classifier)
+
+    async def collect_words(self, parser):
+        return [token.value async for token in parser]
+
+    def test_stream_reader(self):
+        async def parse():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b'Some async')
+            reader.feed_data(b' words')
+            reader.feed_eof()
+            return await self.collect_words(AsyncParser(self._grammar, reader, WordTokenizer, chunk_size=3))
+        self.assertEqual(asyncio.run(parse()), ['Some', 'async', 'words'])
+
+    def test_split_characters(self):
+        reader = ChunkReader([b'caf\xc3', b'\xa9 ', b'au', b' lait'])
+        parser = AsyncParser(self._grammar, reader, WordTokenizer)
+        self.assertEqual(asyncio.run(self.collect_words(parser)), ['café', 'au', 'lait'])
+        self.assertEqual(reader.n_reads, 5)
+        self.assertTrue(parser.parser.is_finished())
+
+    def test_next_token(self):
+        async def parse():
+            parser = AsyncParser(self._grammar, ChunkReader([b'one two']), WordTokenizer)
+            return [(await parser.get_next_token()).value, (await parser.get_next_token()).value]
+        self.assertEqual(asyncio.run(parse()), ['one', 'two'])
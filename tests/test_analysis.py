@@ -0,0 +1,44 @@
+import unittest
+
+from exprail.grammar import Grammar
+from exprail.node import Node, NodeType
+
+from exprail import analysis
+
+
+class AnalysisTest(unittest.TestCase):
+    """Unittest for the FIRST and FOLLOW sets"""
+
+    def test_first_sets(self):
+        grammar = Grammar('grammars/function.grammar')
+        self.assertEqual(grammar.get_first_set('function'), {Node(NodeType.TOKEN, 'keyword')})
+        self.assertEqual(grammar.get_first_set('list'), {Node(NodeType.TOKEN, '[')})
+        self.assertEqual(grammar.get_first_set('function', 7), {Node(NodeType.TOKEN, '[')})
+        self.assertEqual(grammar.get_first_set('function', 8), {
+            Node(NodeType.TOKEN, 'number'),
+            Node(NodeType.TOKEN, '[')
+        })
+        self.assertEqual(grammar.get_first_set('function', 2), frozenset())
+
+    def test_follow_sets(self):
+        grammar = Grammar('grammars/function.grammar')
+        self.assertEqual(grammar.get_follow_set('list'), {
+            Node(NodeType.TOKEN, ')'),
+            Node(NodeType.TOKEN, 'comma')
+        })
+        self.assertEqual(grammar.get_follow_set('function'), frozenset())
+        self.assertEqual(grammar.get_follow_set('skip'), frozenset())
+
+    def test_nullable_positions(self):
+        grammar = Grammar('grammars/function.grammar')
+        nullable_positions = analysis.compute_nullable_positions(grammar)
+        self.assertIn(('function', 9), nullable_positions)
+        self.assertIn(('function', 1), nullable_positions)
+        self.assertNotIn(('function', 3), nullable_positions)
+        self.assertNotIn(('list', 1), nullable_positions)
+
+    def test_reset(self):
+        grammar = Grammar('grammars/function.grammar')
+        _ = grammar.get_follow_set('list')
+        grammar.load_from_file('grammars/number.grammar')
+        self.assertEqual(grammar.get_follow_set('number'), frozenset())
@@ -0,0 +1,135 @@
+import unittest
+
+from exprail.classifier import Classifier
+from exprail.grammar import Grammar
+from exprail.parser import Parser
+from exprail.source import SourceString
+from exprail.state import State
+from exprail.token import Token
+
+from exprail import router
+
+
+class DigitClassifier(Classifier):
+    """Classify number symbol sets by explicit character sets"""
+
+    character_sets = {
+        '0-9': frozenset('0123456789'),
+        '1-9': frozenset('123456789'),
+        'empty': frozenset()
+    }
+
+    @staticmethod
+    def is_in_class(token_class, token):
+        """
+        Distinguish digits, signs and the floating point.
+        :param token_class: 'empty', '0', '0-9', '1-9', '.', '+', '-', 'e', 'E'
+        :param token: the considered token
+        :return: True, when the token is in the class, else False
+        """
+        if token.type == 'char':
+            return token.value in DigitClassifier.get_character_set(token_class)
+        else:
+            return token.type == token_class
+
+    @staticmethod
+    def get_character_set(token_class):
+        """
+        Get the characters of the token class.
+        :param token_class: the name of the token class
+        :return: the set of characters
+        """
+        if token_class in DigitClassifier.character_sets:
+            return DigitClassifier.character_sets[token_class]
+        else:
+            return frozenset(token_class)
+
+
+class DigitParser(Parser):
+    """Collect the stacks of the number grammar"""
+
+    def __init__(self, grammar, source):
+        super(DigitParser, self).__init__(grammar, source)
+        self._result = {}
+
+    @property
+    def result(self):
+        return self._result
+
+    def operate(self, operation, token):
+        """Save the content of the stacks."""
+        if operation == 'save':
+            for stack_name in self._stacks:
+                if stack_name:
+                    self._result[stack_name] = self.get_stack_value(stack_name)
+
+    def show_error(self, message, token):
+        """Show error in the parsing process."""
+        raise ValueError(message)
+
+
+class AutomatonTest(unittest.TestCase):
+    """Unittest for the character level automaton"""
+
+    def test_missing_automaton(self):
+        grammar = Grammar()
+        grammar.load_from_file('grammars/number.grammar')
+        grammar.compile()
+        self.assertIsNone(grammar.automaton)
+
+    def test_uncompiled_positions(self):
+        grammar = Grammar('grammars/number.grammar', classifier=Classifier())
+        self.assertIsNone(grammar.automaton.find_transition('number', 1, '0'))
+
+    def test_transitions(self):
+        grammar = Grammar('grammars/number.grammar', classifier=DigitClassifier())
+        self.assertEqual(grammar.automaton.find_transition('number', 30, '0'), (False, 3))
+        self.assertEqual(grammar.automaton.find_transition('number', 30, '7'), (False, 6))
+        self.assertEqual(grammar.automaton.find_transition('number', 8, 'x'), (False, 28))
+        self.assertEqual(grammar.automaton.find_transition('number', 10, 'x'), (False, 11))
+
+    def test_same_routes(self):
+        grammar = Grammar('grammars/number.grammar', classifier=DigitClassifier())
+        table_grammar = Grammar('grammars/number.grammar', classifier=DigitClassifier())
+        table_grammar.compile()
+        table_grammar._automaton = None
+        for node_id in grammar.expressions['number'].nodes:
+            for character in '0159.eE+-x ':
+                token = Token('char', character)
+                state = State(grammar, 'number', node_id)
+                table_state = State(table_grammar, 'number', node_id)
+                try:
+                    expected_state = router.find_next_state(table_state, token)
+                except RuntimeError:
+                    with self.assertRaises(RuntimeError):
+                        router.find_next_state(state, token)
+                else:
+                    self.assertEqual(router.find_next_state(state, token), expected_state)
+
+    def test_parsing(self):
+        grammar = Grammar('grammars/number.grammar', classifier=DigitClassifier())
+        source = SourceString(r'-1234.5678e-9')
+        parser = DigitParser(grammar, source)
+        parser.parse()
+        expected_result = {
+            'integer': '1234',
+            'fraction': '5678',
+            'exponent': '-9'
+        }
+        self.assertEqual(parser.result, expected_result)
+
+    def test_ground_after_return(self):
+        for filename, error_class, message in [('grammars/caller_ground.grammar', RuntimeError,
+                                                'There is no possible next state!'),
+                                               ('grammars/callee_ground.grammar', ValueError, 'Invalid sub!')]:
+            for has_automaton in [True, False]:
+                grammar = Grammar(filename, classifier=DigitClassifier())
+                if not has_automaton:
+                    grammar._automaton = None
+                parser = DigitParser(grammar, SourceString('ax'))
+                with self.assertRaises(error_class) as context:
+                    parser.parse()
+                self.assertEqual(str(context.exception), message)
+        grammar = Grammar('grammars/callee_ground.grammar', classifier=DigitClassifier())
+        self.assertEqual(grammar.automaton.find_transition('main', 3, 'x'), (True, None))
+        self.assertEqual(grammar.automaton.find_transition('main', 3, 'b'), (False, 4))
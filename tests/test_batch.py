@@ -0,0 +1,114 @@
+import concurrent.futures
+import threading
+import unittest
+import unittest.mock
+
+from exprail.batch import parse_many
+from exprail.classifier import CharClassClassifier
+from exprail.grammar import Grammar
+from exprail.parser import Parser
+
+
+class UnpicklableError(Exception):
+    """Error which can not be sent back from the worker processes"""
+
+    def __init__(self, message, token):
+        super(UnpicklableError, self).__init__(message)
+        self.callback = lambda: token
+
+
+class CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+    """Count the submitted and the pending chunks in threads instead of processes"""
+
+    n_submitted = 0
+    max_pending = 0
+
+    def __init__(self, *args, **kwargs):
+        super(CountingExecutor, self).__init__(*args, **kwargs)
+        CountingExecutor.n_submitted = 0
+        CountingExecutor.max_pending = 0
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def submit(self, *args, **kwargs):
+        future = super(CountingExecutor, self).submit(*args, **kwargs)
+        with self._lock:
+            CountingExecutor.n_submitted += 1
+            self._pending.add(future)
+            CountingExecutor.max_pending = max(CountingExecutor.max_pending, len(self._pending))
+        future.add_done_callback(self.finish)
+        return future
+
+    def finish(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+
+class NumberParser(Parser):
+    """Collect the parts of the number and raise on errors"""
+
+    def show_error(self, message, token):
+        """Raise the error of the node."""
+        raise ValueError(message)
+
+
+class UnpicklableParser(Parser):
+    """Raise an error which is not picklable"""
+
+    def show_error(self, message, token):
+        """Raise the error with a reference to a lambda function."""
+        raise UnpicklableError(message, token)
+
+
+def get_integer_part(parser):
+    return parser.get_stack_value('integer')
+
+
+class BatchTest(unittest.TestCase):
+    """Unittest for the parse_many function"""
+
+    def setUp(self):
+        classifier = CharClassClassifier(type_classes={'empty': 'empty'})
+        self._grammar = Grammar('grammars/number.grammar', classifier=classifier)
+        self._inputs = [str(value) for value in range(-50, 50)] + ['+1', '1.', '007']
+
+    def check_results(self, results):
+        self.assertEqual(len(results), len(self._inputs))
+        for source, (value, error) in zip(self._inputs[:100], results):
+            self.assertIsNone(error)
+            self.assertEqual(value, source.lstrip('-'))
+        for value, error in results[100:]:
+            self.assertIsNone(value)
+            self.assertEqual(error[0], 'ValueError')
+            self.assertIsInstance(error[1], str)
+
+    def test_current_process(self):
+        results = parse_many(self._grammar, NumberParser, self._inputs, workers=1, result=get_integer_part)
+        self.check_results(results)
+
+    def test_worker_processes(self):
+        results = parse_many(self._grammar, NumberParser, iter(self._inputs), workers=2, chunk_size=7,
+                             result=get_integer_part)
+        self.check_results(results)
+
+    def test_parser_tokens(self):
+        results = parse_many(self._grammar, NumberParser, ['1', '2'], workers=2)
+        self.assertEqual([(token.type, error) for token, error in results], [('empty', None), ('empty', None)])
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            parse_many(self._grammar, NumberParser, [], chunk_size=0)
+
+    def test_unpicklable_errors(self):
+        results = parse_many(self._grammar, UnpicklableParser, ['1', '+1'], workers=2, chunk_size=1,
+                             result=get_integer_part)
+        self.assertEqual(results[0], ('1', None))
+        self.assertEqual(results[1][1][0], 'UnpicklableError')
+
+    def test_submission_window(self):
+        with unittest.mock.patch.object(concurrent.futures, 'ProcessPoolExecutor', CountingExecutor):
+            results = parse_many(self._grammar, NumberParser, (str(value) for value in range(1000)), workers=2,
+                                 chunk_size=10, result=get_integer_part)
+        self.assertEqual([value for value, error in results], [str(value) for value in range(1000)])
+        self.assertEqual(CountingExecutor.n_submitted, 100)
+        self.assertLessEqual(CountingExecutor.max_pending, 4)
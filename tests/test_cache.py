@@ -0,0 +1,37 @@
+import unittest
+
+from exprail.cache import LRUCache
+
+
+class LRUCacheTest(unittest.TestCase):
+    """Unittest for the LRU cache"""
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            _ = LRUCache(0)
+
+    def test_hits_and_misses(self):
+        cache = LRUCache(4)
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('b', 2), 2)
+        self.assertEqual(cache.get_stats(), {'hits': 1, 'misses': 2, 'size': 1, 'maxsize': 4})
+
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        _ = cache.get('a')
+        cache.put('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_clear(self):
+        cache = LRUCache()
+        cache.put('a', 1)
+        _ = cache.get('a')
+        cache.clear()
+        self.assertEqual(cache.get_stats(), {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 1024})
@@ -0,0 +1,140 @@
+import unittest
+
+from exprail.classifier import CachingClassifier, CharClassClassifier, Classifier
+from exprail.grammar import Grammar
+from exprail.parser import Parser
+from exprail.source import SourceString
+from exprail.token import Token
+
+
+class CountingClassifier(Classifier):
+    """Count the classifications of the vowel class"""
+
+    def __init__(self):
+        self.n_calls = 0
+
+    def is_in_class(self, token_class, token):
+        """
+        Distinguish the vowels.
+        :param token_class: 'vowel'
+        :param token: the considered token
+        :return: True, when the token is in the class, else None
+        """
+        self.n_calls += 1
+        if token.value in 'aeiou':
+            return True
+
+
+class StackParser(Parser):
+    """Collect the stacks on the save operation"""
+
+    def __init__(self, grammar, source):
+        super(StackParser, self).__init__(grammar, source)
+        self._result = {}
+
+    @property
+    def result(self):
+        return self._result
+
+    def operate(self, operation, token):
+        """Save the content of the stacks."""
+        if operation == 'save':
+            for stack_name in self._stacks:
+                if stack_name:
+                    self._result[stack_name] = self.get_stack_value(stack_name)
+
+    def show_error(self, message, token):
+        """Show error in the parsing process."""
+        raise ValueError(message)
+
+
+class CachingClassifierTest(unittest.TestCase):
+    """Unittest for the caching classifier"""
+
+    def test_memoized_results(self):
+        classifier = CachingClassifier(CountingClassifier(), maxsize=8)
+        for _ in range(3):
+            self.assertTrue(classifier.is_in_class('vowel', Token('char', 'a')))
+            self.assertFalse(classifier.is_in_class('vowel', Token('char', 'b')))
+        self.assertEqual(classifier.classifier.n_calls, 2)
+        self.assertEqual(classifier.get_stats(), {'hits': 4, 'misses': 2, 'size': 2, 'maxsize': 8})
+
+    def test_token_type_in_key(self):
+        classifier = CachingClassifier(CountingClassifier())
+        self.assertTrue(classifier.is_in_class('vowel', Token('char', 'a')))
+        self.assertTrue(classifier.is_in_class('vowel', Token('name', 'a')))
+        self.assertEqual(classifier.classifier.n_calls, 2)
+
+    def test_character_set(self):
+        classifier = CachingClassifier(CountingClassifier())
+        self.assertIsNone(classifier.get_character_set('vowel'))
+
+
+class BatchClassifierTest(unittest.TestCase):
+    """Unittest for the batched classification"""
+
+    def test_default_batch(self):
+        classifier = CountingClassifier()
+        token_classes = {'vowel', 'other'}
+        self.assertEqual(classifier.is_in_classes(token_classes, Token('char', 'a')), token_classes)
+        self.assertEqual(classifier.is_in_classes(token_classes, Token('char', 'b')), set())
+        self.assertEqual(classifier.n_calls, 4)
+
+    def test_cached_batch(self):
+        classifier = CachingClassifier(CountingClassifier())
+        self.assertEqual(classifier.is_in_classes({'vowel'}, Token('char', 'e')), {'vowel'})
+        self.assertEqual(classifier.is_in_classes({'vowel'}, Token('char', 'e')), {'vowel'})
+        self.assertEqual(classifier.classifier.n_calls, 1)
+
+
+class CharClassClassifierTest(unittest.TestCase):
+    """Unittest for the character class classifier"""
+
+    def test_class_specs(self):
+        self.assertEqual(CharClassClassifier.parse_class_spec('0-3'), frozenset('0123'))
+        self.assertEqual(CharClassClassifier.parse_class_spec('+-'), frozenset('+-'))
+        self.assertEqual(CharClassClassifier.parse_class_spec('a-c_X-Z'), frozenset('abc_XYZ'))
+        self.assertEqual(CharClassClassifier.parse_class_spec('-'), frozenset('-'))
+        with self.assertRaises(ValueError):
+            _ = CharClassClassifier.parse_class_spec('')
+        with self.assertRaises(ValueError):
+            _ = CharClassClassifier.parse_class_spec('9-0')
+        with self.assertRaises(ValueError):
+            _ = CharClassClassifier.parse_class_spec('0-Z')
+        with self.assertRaises(ValueError):
+            _ = CharClassClassifier.parse_class_spec('A-z')
+        self.assertEqual(CharClassClassifier.parse_class_spec('!-/'), frozenset('!"#$%&\'()*+,-./'))
+
+    def test_classification(self):
+        char_classes = {'ws': ' \t', 'a-z': CharClassClassifier.parse_class_spec('a-z')}
+        classifier = CharClassClassifier(char_classes=char_classes, type_classes={'end': 'empty'})
+        self.assertTrue(classifier.is_in_class('ws', Token('char', '\t')))
+        self.assertFalse(classifier.is_in_class('ws', Token('char', 'x')))
+        self.assertTrue(classifier.is_in_class('a-z', Token('char', 'x')))
+        self.assertTrue(classifier.is_in_class('end', Token('empty', '')))
+        self.assertFalse(classifier.is_in_class('end', Token('char', 'e')))
+        self.assertFalse(classifier.is_in_class('a-z', Token('empty', '')))
+        self.assertEqual(classifier.is_in_classes({'ws', 'a-z', 'end'}, Token('char', 'q')), {'a-z'})
+        self.assertEqual(classifier.is_in_classes({'ws', 'a-z', 'end'}, Token('empty', '')), {'end'})
+        with self.assertRaises(ValueError):
+            classifier.is_in_class('A-Z', Token('char', 'X'))
+
+    def test_binding(self):
+        classifier = CharClassClassifier(type_classes={'empty': 'empty'})
+        grammar = Grammar('grammars/number.grammar', classifier=classifier)
+        self.assertEqual(classifier.get_character_set('1-9'), frozenset('123456789'))
+        self.assertEqual(classifier.get_character_set('empty'), frozenset())
+        self.assertEqual(grammar.automaton.find_transition('number', 30, '5'), (False, 6))
+        matching_classes = classifier.is_in_classes(frozenset({'0', '0-9', '1-9', '.'}), Token('char', '5'))
+        self.assertEqual(matching_classes, frozenset({'0-9', '1-9'}))
+        self.assertIsInstance(matching_classes, frozenset)
+        self.assertEqual(classifier.is_in_classes({'0', '0-9'}, Token('char', '0')), {'0', '0-9'})
+        self.assertEqual(classifier.is_in_classes({'0-9', 'empty'}, Token('empty', '')), {'empty'})
+        self.assertEqual(classifier.is_in_classes({'0-9'}, Token('char', 'x')), set())
+
+    def test_parsing(self):
+        classifier = CharClassClassifier(type_classes={'empty': 'empty'})
+        grammar = Grammar('grammars/number.grammar', classifier=classifier)
+        parser = StackParser(grammar, SourceString('-12.5e+3'))
+        parser.parse()
+        self.assertEqual(parser.result, {'integer': '12', 'fraction': '5', 'exponent': '3'})
@@ -42,7 +42,7 @@ class EscapedParser(Parser):
     def operate(self, operation, token):
         """Print the token value on print operation."""
         if operation == 'save':
-            self._result = ''.join(self._stacks[''])
+            self._result = self.get_stack_value('')
         else:
             raise ValueError('The "{}" is an invalid operation!'.format(operation))
 
@@ -0,0 +1,58 @@
+import unittest
+
+from exprail.expression import Expression
+from exprail.grammar import Grammar
+from exprail.node import Node
+
+
+class ExpressionTest(unittest.TestCase):
+    """Unittest for the Expression class"""
+
+    def test_start_node(self):
+        expression = Expression()
+        with self.assertRaises(RuntimeError):
+            _ = expression.get_start_node_id()
+        expression.add_node(2, Node('finish'))
+        expression.add_node(1, Node('start'))
+        expression.add_node(3, Node('start'))
+        self.assertEqual(expression.get_start_node_id(), 1)
+        expression.add_node(1, Node('connection'))
+        self.assertEqual(expression.get_start_node_id(), 3)
+
+    def test_ground_node(self):
+        expression = Expression()
+        expression.add_node(1, Node('start'))
+        self.assertFalse(expression.has_ground_node())
+        with self.assertRaises(RuntimeError):
+            _ = expression.get_ground_node_id()
+        expression.add_node(5, Node('ground'))
+        self.assertTrue(expression.has_ground_node())
+        self.assertEqual(expression.get_ground_node_id(), 5)
+        expression.add_node(5, Node('finish'))
+        self.assertFalse(expression.has_ground_node())
+
+    def test_entry_expression(self):
+        grammar = Grammar()
+        with self.assertRaises(RuntimeError):
+            _ = grammar.get_entry_expression_name()
+        grammar.add_expression('other', Expression(1))
+        grammar.add_expression('entry', Expression(0))
+        self.assertEqual(grammar.get_entry_expression_name(), 'entry')
+        grammar.add_expression('entry', Expression(2))
+        with self.assertRaises(RuntimeError):
+            _ = grammar.get_entry_expression_name()
+        grammar.load_from_file('grammars/function.grammar')
+        self.assertEqual(grammar.get_entry_expression_name(), 'function')
+
+    def test_source_nodes(self):
+        expression = Expression()
+        for node_id in [1, 2, 3]:
+            expression.add_node(node_id, Node('connection'))
+        expression.add_edge(1, 3)
+        expression.add_edge(2, 3)
+        expression.add_edge(1, 2)
+        self.assertEqual(expression.get_source_node_ids(1), set())
+        self.assertEqual(expression.get_source_node_ids(2), {1})
+        self.assertEqual(expression.get_source_node_ids(3), {1, 2})
+        with self.assertRaises(ValueError):
+            _ = expression.get_source_node_ids(4)
@@ -1,6 +1,7 @@
+import string
 import unittest
 
-from exprail.classifier import Classifier
+from exprail.classifier import CharClassClassifier, Classifier
 from exprail.grammar import Grammar
 from exprail.parser import Parser
 from exprail.source import SourceString
@@ -60,7 +61,7 @@ class FoliumTokenizer(Parser):
         :param token: the considered token
         """
         if operation == 'save':
-            self._value = ''.join(self._stacks[''])
+            self._value = self.get_stack_value('')
         elif operation == 'name':
             self._token = Token('name', self._value)
             self._ready = True
@@ -111,7 +112,25 @@ class FoliumParser(Parser):
 
 
 class FoliumTokenizerTest(unittest.TestCase):
-    pass
+    """Folium tokenizer tests with examples"""
+
+    def test_char_class_classifier(self):
+        with self.assertRaises(ValueError):
+            Grammar('grammars/folium/tokenizer.grammar', classifier=CharClassClassifier(type_classes={'end': 'empty'}))
+        char_classes = {'0-Z': string.ascii_letters + string.digits}
+        classifier = CharClassClassifier(char_classes=char_classes, type_classes={'end': 'empty'})
+        grammar = Grammar('grammars/folium/tokenizer.grammar', classifier=classifier)
+        self.assertTrue(classifier.are_disjoint('0-Z', ';'))
+        self.assertTrue(classifier.are_disjoint('0-Z', '@'))
+        for text in ['"x";', 'name;']:
+            tokenizer = FoliumTokenizer(grammar, SourceString(text))
+            tokenizer.parse()
+            token = tokenizer.get_token()
+            expected_tokenizer = FoliumTokenizer(Grammar('grammars/folium/tokenizer.grammar', TokenizerClassifier()),
+                                                 SourceString(text))
+            expected_tokenizer.parse()
+            expected_token = expected_tokenizer.get_token()
+            self.assertEqual((token.type, token.value), (expected_token.type, expected_token.value))
 
 
 class FoliumParserTest(unittest.TestCase):
@@ -0,0 +1,131 @@
+import os
+import shutil
+import string
+import tempfile
+import unittest
+
+from exprail.classifier import CharClassClassifier
+from exprail.grammar import Grammar
+from exprail.parser import Parser
+from exprail.source import SourceString
+
+from exprail import generator
+
+
+class RecordingParser(Parser):
+    """Record the actions of the parsing process"""
+
+    def __init__(self, grammar, source):
+        super(RecordingParser, self).__init__(grammar, source)
+        self._actions = []
+
+    @property
+    def actions(self):
+        return self._actions
+
+    def operate(self, operation, token):
+        """Record the operation and the content of the stacks."""
+        stacks = {name: self.get_stack_value(name) for name in self._stacks}
+        self._actions.append(('operate', operation, token.value, stacks))
+
+    def show_info(self, message, token):
+        """Record the information."""
+        self._actions.append(('info', message, token.value))
+
+    def show_error(self, message, token):
+        """Stop the parsing on error."""
+        raise ValueError(message)
+
+
+def record_parsing(grammar, text):
+    """
+    Parse the text and collect the actions and the error message.
+    :param grammar: the grammar object
+    :param text: the input text
+    :return: the list of the actions and the error message or None
+    """
+    parser = RecordingParser(grammar, SourceString(text))
+    try:
+        parser.parse()
+    except (ValueError, RuntimeError) as error:
+        return parser.actions, str(error)
+    return parser.actions, None
+
+
+class GeneratorTest(unittest.TestCase):
+    """Unittest for the generated parser programs"""
+
+    samples = {
+        'grammars/number.grammar': (
+            CharClassClassifier(type_classes={'empty': 'empty'}),
+            ['', '0', '+1', '-12.5e+3', '1234.e', '0E-100', '1.5x', 'abc']
+        ),
+        'grammars/integer_list.grammar': (
+            CharClassClassifier(char_classes={'ws': ' '}),
+            ['[]', '[1, 2, 3]', '[12,3', '[ 4 ]', '[,]']
+        ),
+        'grammars/words.grammar': (
+            CharClassClassifier(char_classes={'ws': ' ', 'a-Z': 'abcdefghijklmnopqrstuvwxyz'}),
+            ['', 'one', 'one two  three ', '   ']
+        ),
+        'grammars/folium/tokenizer.grammar': (
+            CharClassClassifier(char_classes={'0-Z': string.ascii_letters + string.digits},
+                                type_classes={'end': 'empty'}),
+            ['bbb"', '"x";', 'name;', '"a\\"b"', '"open']
+        )
+    }
+
+    def test_same_actions(self):
+        for filename, (classifier, texts) in self.samples.items():
+            grammar = Grammar(filename, classifier=classifier)
+            program_grammar = Grammar(filename, classifier=classifier)
+            program_grammar.set_program(generator.load_program(filename))
+            for text in texts:
+                self.assertEqual(record_parsing(program_grammar, text), record_parsing(grammar, text))
+
+    def test_uncompiled_grammar(self):
+        grammar = Grammar()
+        grammar.load_from_file('grammars/number.grammar')
+        with self.assertRaises(ValueError):
+            _ = generator.generate_source(grammar)
+
+    def test_program_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            program = generator.load_program('grammars/number.grammar', cache_dir)
+            filenames = os.listdir(cache_dir)
+            self.assertEqual(len([filename for filename in filenames if filename.endswith('.py')]), 1)
+            self.assertIn(generator.get_grammar_hash('grammars/number.grammar'), filenames[0])
+            cached_program = generator.load_program('grammars/number.grammar', cache_dir)
+            self.assertEqual(os.listdir(cache_dir), filenames)
+            self.assertEqual(program.__name__, cached_program.__name__)
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_parsing_after_finish(self):
+        grammar = Grammar('grammars/number.grammar', classifier=CharClassClassifier(type_classes={'empty': 'empty'}))
+        grammar.set_program(generator.load_program('grammars/number.grammar'))
+        parser = RecordingParser(grammar, SourceString('42'))
+        parser.parse()
+        self.assertEqual(parser.actions[-1], ('operate', 'save', '', {'': '', 'integer': '42'}))
+        n_actions = len(parser.actions)
+        parser.parse()
+        self.assertEqual(len(parser.actions), n_actions)
+        self.assertEqual(parser.get_token().type, 'empty')
+
+    def test_nested_calls(self):
+        grammar = Grammar('grammars/nested.grammar', classifier=CharClassClassifier())
+        program_grammar = Grammar('grammars/nested.grammar', classifier=CharClassClassifier())
+        program_grammar.set_program(generator.load_program('grammars/nested.grammar'))
+        for text in ['x', '(x)', '((x))', '((x)', '(x))', '()']:
+            self.assertEqual(record_parsing(program_grammar, text), record_parsing(grammar, text))
+
+    def test_deep_nesting(self):
+        grammar = Grammar('grammars/nested.grammar', classifier=CharClassClassifier())
+        program_grammar = Grammar('grammars/nested.grammar', classifier=CharClassClassifier())
+        program_grammar.set_program(generator.load_program('grammars/nested.grammar'))
+        text = '(' * 3000 + 'x' + ')' * 3000
+        actions, error = record_parsing(program_grammar, text)
+        self.assertIsNone(error)
+        self.assertEqual(len(actions), 3000)
+        self.assertEqual(record_parsing(grammar, text), (actions, error))
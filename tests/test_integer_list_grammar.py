@@ -44,7 +44,7 @@ class ListParser(Parser):
     def operate(self, operation, token):
         """Print the token value on print operation."""
         if operation == 'add':
-            number = int(''.join(self._stacks['']))
+            number = int(self.get_stack_value(''))
             self._result.append(number)
         elif operation == 'save':
             pass
@@ -52,11 +52,11 @@ class NumberParser(Parser):
         elif operation == 'non-negative':
             self._result['sign'] = '+'
         elif operation == 'save':
-            self._result['integer'] = ''.join(self._stacks['integer'])
+            self._result['integer'] = self.get_stack_value('integer')
             if 'fraction' in self._stacks:
-                self._result['fraction'] = ''.join(self._stacks['fraction'])
+                self._result['fraction'] = self.get_stack_value('fraction')
             if 'exponent' in self._stacks:
-                self._result['exponent'] = ''.join(self._stacks['exponent'])
+                self._result['exponent'] = self.get_stack_value('exponent')
         else:
             raise ValueError('The "{}" is an invalid operation!'.format(operation))
 
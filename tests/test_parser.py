@@ -0,0 +1,223 @@
+import string
+import unittest
+
+from exprail.classifier import CharClassClassifier
+from exprail.grammar import Grammar
+from exprail.node import NodeType
+from exprail.parser import Parser, operation, stack
+from exprail.source import SourceFeed, SourceString
+from exprail.token import Token
+from exprail import generator
+
+
+class TracingParser(Parser):
+    """Trace the connection and information nodes"""
+
+    node_handler_names = dict(Parser.node_handler_names)
+    node_handler_names[NodeType.CONNECTION] = 'process_connection_node'
+
+    def __init__(self, grammar, source):
+        super(TracingParser, self).__init__(grammar, source)
+        self._trace = []
+
+    @property
+    def trace(self):
+        return self._trace
+
+    def process_connection_node(self, node, token):
+        """Trace the connection."""
+        self._trace.append(('connection', token.value))
+
+    def process_info_node(self, node, token):
+        """Trace the information instead of printing it."""
+        self._trace.append(('info', node.value))
+
+
+class NumberParser(Parser):
+    """Collect the number parts by decorated action handlers"""
+
+    def __init__(self, grammar, source):
+        super(NumberParser, self).__init__(grammar, source)
+        self._parts = {}
+        self._sign = None
+
+    @property
+    def parts(self):
+        return self._parts
+
+    @property
+    def sign(self):
+        return self._sign
+
+    @stack('integer')
+    @stack('fraction')
+    @stack('exponent')
+    def collect_digit(self, token):
+        """Collect the digits of the number parts."""
+        self._parts.setdefault(token.value, 0)
+        self._parts[token.value] += 1
+
+    @operation('negative')
+    def set_negative(self, token):
+        self._sign = '-'
+
+    @operation('non-negative')
+    def set_non_negative(self, token):
+        self._sign = '+'
+
+    @operation('save')
+    def save(self, token):
+        pass
+
+
+class IncompleteParser(Parser):
+    """Register only some of the operations of the number grammar"""
+
+    @operation('save')
+    def save(self, token):
+        pass
+
+
+class WordTokenizer(Parser):
+    """Provide the words of the source as tokens"""
+
+    def operate(self, operation, token):
+        """Provide the collected word."""
+        self._token = Token('word', self.get_stack_value(''))
+        self._ready = True
+
+
+class ParserTest(unittest.TestCase):
+    """Unittest for the Parser class"""
+
+    def test_node_handlers(self):
+        handlers = Parser.get_node_handlers()
+        self.assertIs(handlers[NodeType.TOKEN], Parser.process_token_node)
+        self.assertNotIn(NodeType.CONNECTION, handlers)
+        tracing_handlers = TracingParser.get_node_handlers()
+        self.assertIs(tracing_handlers[NodeType.CONNECTION], TracingParser.process_connection_node)
+        self.assertIs(tracing_handlers[NodeType.INFO], TracingParser.process_info_node)
+        self.assertIs(Parser.get_node_handlers(), handlers)
+
+    def test_custom_handlers(self):
+        grammar = Grammar('grammars/route_samples.grammar', classifier=CharClassClassifier())
+        parser = TracingParser(grammar, SourceString('ab'))
+        parser.parse()
+        self.assertEqual(parser.trace, [('info', 'init'), ('connection', 'b')])
+
+    def test_registered_actions(self):
+        grammar = Grammar('grammars/number.grammar', classifier=CharClassClassifier())
+        parser = NumberParser(grammar, SourceString('-12.5'))
+        parser.parse()
+        self.assertEqual(parser.sign, '-')
+        self.assertEqual(parser.parts, {'1': 1, '2': 1, '5': 1})
+        self.assertEqual(Parser.get_registered_actions(), {})
+
+    def test_missing_action_handler(self):
+        grammar = Grammar('grammars/number.grammar', classifier=CharClassClassifier())
+        with self.assertRaises(ValueError):
+            IncompleteParser(grammar, SourceString('12'))
+
+    def test_generic_action_handler(self):
+        grammar = Grammar('grammars/number.grammar', classifier=CharClassClassifier())
+        parser = Parser(grammar, SourceString('12'))
+        handler = parser.get_action_handler(NodeType.STACK, 'integer')
+        handler(Token('char', '1'))
+        self.assertEqual(parser._stacks['integer'], ['1'])
+
+    def test_iter_tokens(self):
+        classifier = CharClassClassifier(char_classes={'ws': ' ', 'a-Z': string.ascii_letters})
+        grammar = Grammar('grammars/words.grammar', classifier=classifier)
+        parser = WordTokenizer(grammar, SourceString('Some simple words'))
+        self.assertEqual([token.value for token in parser.iter_tokens()], ['Some', 'simple', 'words'])
+        self.assertTrue(parser.is_finished())
+        self.assertEqual(list(parser), [])
+        parser = WordTokenizer(grammar, SourceString(''))
+        self.assertEqual(list(parser), [])
+
+    def test_iter_program_tokens(self):
+        classifier = CharClassClassifier(char_classes={'ws': ' ', 'a-Z': string.ascii_letters})
+        grammar = Grammar('grammars/words.grammar', classifier=classifier)
+        grammar.set_program(generator.load_program('grammars/words.grammar'))
+        parser = WordTokenizer(grammar, SourceString(' two  words '))
+        self.assertEqual([token.value for token in parser], ['two', 'words'])
+        self.assertTrue(parser.is_finished())
+
+    def test_parser_source(self):
+        classifier = CharClassClassifier(char_classes={'ws': ' ', 'a-Z': string.ascii_letters})
+        tokenizer = WordTokenizer(Grammar('grammars/words.grammar', classifier=classifier), SourceString('a pipe line'))
+        grammar = Grammar('grammars/word_list.grammar', classifier=CharClassClassifier(type_classes={'word': 'word'}))
+        parser = Parser(grammar, tokenizer)
+        parser.parse()
+        self.assertTrue(parser.is_finished())
+        self.assertEqual(parser._stacks['words'], ['a', 'pipe', 'line'])
+        self.assertEqual(tokenizer.get_token().type, 'empty')
+        tokenizer.parse()
+        self.assertEqual(tokenizer.get_token().type, 'empty')
+
+    def test_feed(self):
+        classifier = CharClassClassifier(char_classes={'ws': ' ', 'a-Z': string.ascii_letters})
+        grammar = Grammar('grammars/words.grammar', classifier=classifier)
+        for program in [None, generator.load_program('grammars/words.grammar')]:
+            grammar.set_program(program)
+            parser = WordTokenizer(grammar, SourceFeed())
+            self.assertEqual([token.value for token in parser.feed('Some si')], ['Some'])
+            self.assertEqual([token.value for token in parser.feed('mple wor')], ['simple'])
+            self.assertEqual(parser.feed('ds'), [])
+            self.assertFalse(parser.is_finished())
+            self.assertEqual([token.value for token in parser.close()], ['words'])
+            self.assertTrue(parser.is_finished())
+
+    def test_snapshot(self):
+        classifier = CharClassClassifier(char_classes={'ws': ' ', 'a-Z': string.ascii_letters})
+        grammar = Grammar('grammars/words.grammar', classifier=classifier)
+        parser = WordTokenizer(grammar, SourceString('one two three'))
+        self.assertEqual(parser.get_next_token().value, 'one')
+        snapshot = parser.snapshot()
+        self.assertEqual([token.value for token in parser], ['two', 'three'])
+        self.assertTrue(parser.is_finished())
+        parser.restore(snapshot)
+        self.assertFalse(parser.is_finished())
+        self.assertEqual(parser.get_token().value, 'one')
+        self.assertEqual(parser._stacks[''], ['o', 'n', 'e'])
+        self.assertEqual([token.value for token in parser], ['two', 'three'])
+        parser.restore(snapshot)
+        self.assertEqual(parser.get_next_token().value, 'two')
+
+    def test_program_snapshot(self):
+        classifier = CharClassClassifier(char_classes={'ws': ' ', 'a-Z': string.ascii_letters})
+        grammar = Grammar('grammars/words.grammar', classifier=classifier)
+        grammar.set_program(generator.load_program('grammars/words.grammar'))
+        parser = WordTokenizer(grammar, SourceString('one two'))
+        with self.assertRaises(RuntimeError):
+            parser.snapshot()
+
+    def test_program_custom_handlers(self):
+        grammar = Grammar('grammars/route_samples.grammar', classifier=CharClassClassifier())
+        grammar.set_program(generator.load_program('grammars/route_samples.grammar'))
+        with self.assertRaises(ValueError):
+            TracingParser(grammar, SourceString('ab'))
+        parser = Parser(grammar, SourceString('ab'))
+        self.assertIsNotNone(parser._runner)
+
+    def test_feed_pipeline(self):
+        classifier = CharClassClassifier(char_classes={'ws': ' ', 'a-Z': string.ascii_letters})
+        tokenizer = WordTokenizer(Grammar('grammars/words.grammar', classifier=classifier), SourceFeed())
+        grammar = Grammar('grammars/word_list.grammar', classifier=CharClassClassifier(type_classes={'word': 'word'}))
+        parser = Parser(grammar, tokenizer)
+        for chunk in ['ab cd', ' ef', ' gh']:
+            self.assertEqual(parser.feed(chunk), [])
+            self.assertFalse(parser.is_finished())
+        self.assertEqual(parser._stacks['words'], ['ab', 'cd', 'ef'])
+        self.assertEqual(parser.close(), [])
+        self.assertTrue(parser.is_finished())
+        self.assertEqual(parser._stacks['words'], ['ab', 'cd', 'ef', 'gh'])
+
+    def test_empty_feed_pipeline(self):
+        classifier = CharClassClassifier(char_classes={'ws': ' ', 'a-Z': string.ascii_letters})
+        tokenizer = WordTokenizer(Grammar('grammars/words.grammar', classifier=classifier), SourceFeed())
+        grammar = Grammar('grammars/word_list.grammar', classifier=CharClassClassifier(type_classes={'word': 'word'}))
+        parser = Parser(grammar, tokenizer)
+        self.assertEqual(parser.close(), [])
+        self.assertTrue(parser.is_finished())
+        self.assertNotIn('words', parser._stacks)
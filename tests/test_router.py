@@ -355,3 +355,35 @@ class RouterTest(unittest.TestCase):
         grammar = Grammar('grammars/route_samples.grammar', classifier=SampleClassifier())
         state = State(grammar, 'sample', 6)
         self.assertFalse(router.has_default_successor(state))
+
+    def test_routing_table(self):
+        compiled_grammar = Grammar('grammars/function.grammar', classifier=FunctionClassifier())
+        grammar = Grammar(classifier=FunctionClassifier())
+        grammar.load_from_file('grammars/function.grammar')
+        self.assertIsNone(grammar.routing_table)
+        token_types = ['keyword', 'number', 'comma', '(', ')', '[', ']', 'whitespace', 'empty']
+        return_states = [None, State(grammar, 'function', 7)]
+        for return_state in return_states:
+            for expression_name, expression in grammar.expressions.items():
+                for node_id in expression.nodes:
+                    for token_type in token_types:
+                        token = Token(token_type, '')
+                        state = State(grammar, expression_name, node_id, return_state)
+                        compiled_state = State(compiled_grammar, expression_name, node_id, return_state)
+                        try:
+                            expected_state = router.find_next_state(state, token)
+                        except RuntimeError:
+                            with self.assertRaises(RuntimeError):
+                                router.find_next_state(compiled_state, token)
+                        else:
+                            self.assertEqual(router.find_next_state(compiled_state, token), expected_state)
+
+    def test_forced_paths(self):
+        grammar = Grammar('grammars/number.grammar')
+        routing_table = grammar.routing_table
+        self.assertEqual(routing_table.get_forced_path('number', 24), (5,))
+        self.assertEqual(routing_table.get_forced_path('number', 26), (8,))
+        self.assertEqual(routing_table.get_forced_path('number', 38), (2,))
+        self.assertEqual(routing_table.get_forced_path('number', 30), ())
+        self.assertEqual(routing_table.get_forced_path('number', 9), ())
+        self.assertEqual(routing_table.get_forced_path('number', 1), ())
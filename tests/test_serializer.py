@@ -0,0 +1,89 @@
+import pickle
+import unittest
+
+from exprail.classifier import CharClassClassifier
+from exprail.grammar import Grammar
+from exprail.parser import Parser
+from exprail.source import SourceString
+from exprail import serializer
+
+
+class UncompilableGrammar(Grammar):
+    """Fail on the compilation of the routing table"""
+
+    def compile(self):
+        raise AssertionError('The grammar has been compiled!')
+
+
+class SerializerTest(unittest.TestCase):
+    """Unittest for the grammar serialization"""
+
+    def assert_same_expressions(self, grammar, other_grammar):
+        self.assertEqual(set(grammar.expressions), set(other_grammar.expressions))
+        self.assertEqual(grammar.get_entry_expression_name(), other_grammar.get_entry_expression_name())
+        for name, expression in grammar.expressions.items():
+            other_expression = other_grammar.expressions[name]
+            self.assertEqual(expression.nodes, other_expression.nodes)
+            self.assertEqual(expression.get_index(), other_expression.get_index())
+            for node_id in expression.nodes:
+                self.assertEqual(expression.get_target_node_ids(node_id),
+                                 other_expression.get_target_node_ids(node_id))
+                self.assertEqual(expression.get_source_node_ids(node_id),
+                                 other_expression.get_source_node_ids(node_id))
+
+    def test_round_trip(self):
+        filenames = [
+            'grammars/escaped.grammar',
+            'grammars/function.grammar',
+            'grammars/integer_list.grammar',
+            'grammars/number.grammar',
+            'grammars/folium/tokenizer.grammar',
+            'grammars/folium/parser.grammar'
+        ]
+        for filename in filenames:
+            grammar = Grammar(filename)
+            data = grammar.to_bytes()
+            self.assertTrue(data.startswith(serializer.MAGIC))
+            other_grammar = UncompilableGrammar.from_bytes(data)
+            self.assert_same_expressions(grammar, other_grammar)
+            self.assert_same_routing_tables(grammar, other_grammar)
+            self.assertEqual(other_grammar.to_bytes(), data)
+
+    def assert_same_routing_tables(self, grammar, other_grammar):
+        routing_table = grammar.routing_table
+        other_routing_table = other_grammar.routing_table
+        for name, expression in grammar.expressions.items():
+            self.assertEqual(routing_table.get_ground_node_id(name), other_routing_table.get_ground_node_id(name))
+            for node_id in expression.nodes:
+                for method_name in ['get_candidates', 'get_token_classes', 'get_default_node_id', 'get_forced_path']:
+                    self.assertEqual(getattr(routing_table, method_name)(name, node_id),
+                                     getattr(other_routing_table, method_name)(name, node_id))
+
+    def test_uncompiled_grammar(self):
+        grammar = Grammar()
+        grammar.load_from_file('grammars/number.grammar')
+        other_grammar = Grammar.from_bytes(grammar.to_bytes())
+        self.assert_same_expressions(grammar, other_grammar)
+        self.assertIsNotNone(other_grammar.routing_table)
+
+    def test_invalid_data(self):
+        with self.assertRaises(ValueError):
+            Grammar.from_bytes(b'grammar')
+        with self.assertRaises(ValueError):
+            Grammar.from_bytes(serializer.MAGIC + b'\xff')
+        data = Grammar('grammars/number.grammar').to_bytes()
+        for invalid_data in [data[:-1], data + b'\x00', data[:7] + b'\x01' + data[8:], data[:40]]:
+            with self.assertRaises(ValueError):
+                Grammar.from_bytes(invalid_data)
+
+    def test_pickle(self):
+        classifier = CharClassClassifier(type_classes={'empty': 'empty'})
+        grammar = Grammar('grammars/number.grammar', classifier=classifier)
+        grammar.enable_trusted_routing()
+        other_grammar = pickle.loads(pickle.dumps(grammar))
+        self.assert_same_expressions(grammar, other_grammar)
+        self.assertTrue(other_grammar.is_trusted())
+        self.assertIsInstance(other_grammar.classifier, CharClassClassifier)
+        parser = Parser(other_grammar, SourceString('-1.5e3'))
+        parser.parse()
+        self.assertEqual(parser._stacks['exponent'], ['3'])
@@ -0,0 +1,67 @@
+import unittest
+
+from exprail.source import InputPending, SourceFeed, SourceString
+
+
+class SourceFeedTest(unittest.TestCase):
+    """Unittest for the SourceFeed class"""
+
+    def test_pending_input(self):
+        source = SourceFeed()
+        source.parse()
+        with self.assertRaises(InputPending):
+            source.get_token()
+        source.feed('ab')
+        self.assertEqual(source.get_token().value, 'a')
+        self.assertEqual(source.get_token().value, 'a')
+        source.parse()
+        self.assertEqual(source.get_token().value, 'b')
+        source.parse()
+        with self.assertRaises(InputPending):
+            source.get_token()
+
+    def test_closed_input(self):
+        source = SourceFeed()
+        source.feed('a')
+        source.close()
+        self.assertTrue(source.is_closed())
+        source.parse()
+        self.assertEqual(source.get_token().type, 'char')
+        source.parse()
+        self.assertEqual(source.get_token().type, 'empty')
+        source.parse()
+        self.assertEqual(source.get_token().type, 'empty')
+        with self.assertRaises(ValueError):
+            source.feed('b')
+
+    def test_snapshot(self):
+        source = SourceFeed()
+        source.feed('abc')
+        source.parse()
+        self.assertEqual(source.get_token().value, 'a')
+        snapshot = source.snapshot()
+        source.parse()
+        self.assertEqual(source.get_token().value, 'b')
+        source.restore(snapshot)
+        self.assertEqual(source.get_token().value, 'a')
+        source.parse()
+        self.assertEqual(source.get_token().value, 'b')
+        source.feed('d')
+        with self.assertRaises(ValueError):
+            source.restore(snapshot)
+
+
+class SourceStringTest(unittest.TestCase):
+    """Unittest for the SourceString class"""
+
+    def test_snapshot(self):
+        source = SourceString('ab')
+        source.parse()
+        snapshot = source.snapshot()
+        source.parse()
+        source.parse()
+        self.assertEqual(source.get_token().type, 'empty')
+        source.restore(snapshot)
+        self.assertEqual(source.get_token().value, 'a')
+        source.parse()
+        self.assertEqual(source.get_token().value, 'b')
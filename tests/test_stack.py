@@ -0,0 +1,118 @@
+import string
+import unittest
+
+from exprail.classifier import CharClassClassifier
+from exprail.grammar import Grammar
+from exprail.parser import Parser
+from exprail.source import SourceString
+from exprail.stack import SpanStack
+
+
+class SpanParser(Parser):
+    """Store the characters of the source as spans"""
+
+    use_span_stacks = True
+
+
+class ListResetParser(SpanParser):
+    """Reset the stacks to lists on the clean nodes"""
+
+    def clean_stack(self, stack_name, token):
+        """Use a list instead of the span stack."""
+        self._stacks[stack_name] = []
+
+
+class SpanStackTest(unittest.TestCase):
+    """Unittest for the SpanStack class"""
+
+    def test_spans(self):
+        stack = SpanStack('abcdef')
+        for position in [1, 2, 3, 5]:
+            stack.append_position(position)
+        stack.append('x')
+        stack.append_position(0)
+        self.assertEqual(len(stack), 6)
+        self.assertEqual(stack._parts, [(1, 4), (5, 6), 'x', (0, 1)])
+        self.assertEqual(stack.get_value(), 'bcdfxa')
+        self.assertEqual(''.join(stack), 'bcdfxa')
+        self.assertEqual(stack, ['b', 'c', 'd', 'f', 'x', 'a'])
+        self.assertEqual(stack[1], 'c')
+        self.assertEqual(stack[-2:], ['x', 'a'])
+
+    def test_copy(self):
+        stack = SpanStack('abcdef')
+        for position in [0, 1, 2, 4]:
+            stack.append_position(position)
+        prefix = stack[:2]
+        self.assertIsInstance(prefix, SpanStack)
+        self.assertEqual(prefix.get_value(), 'ab')
+        prefix.append_position(3)
+        self.assertEqual(prefix.get_value(), 'abd')
+        self.assertEqual(stack.get_value(), 'abce')
+        self.assertEqual(stack[:10].get_value(), 'abce')
+        self.assertEqual(len(stack[:0]), 0)
+
+    def test_list_methods(self):
+        stack = SpanStack('abcdef')
+        for position in [0, 1, 2, 3]:
+            stack.append_position(position)
+        values = ['a', 'b', 'c', 'd']
+        self.assertEqual(stack[-1], 'd')
+        self.assertEqual(stack[0], 'a')
+        for operation in [lambda s: s.insert(2, 'x'), lambda s: s.insert(-10, 'y'), lambda s: s.insert(10, 'z'),
+                          lambda s: s.__setitem__(-2, 'w'), lambda s: s.extend(['u', 'v']),
+                          lambda s: s.__delitem__(3), lambda s: s.__setitem__(slice(1, 3), ['q'])]:
+            operation(stack)
+            operation(values)
+            self.assertEqual(stack, values)
+            self.assertEqual(len(stack), len(values))
+            self.assertEqual([stack[index] for index in range(-len(values), len(values))], values + values)
+        self.assertEqual(stack.pop(), values.pop())
+        self.assertEqual(stack.pop(1), values.pop(1))
+        self.assertEqual(stack, values)
+        self.assertEqual(stack.get_value(), ''.join(values))
+        with self.assertRaises(IndexError):
+            stack[len(values)]
+        stack.clear()
+        self.assertEqual(len(stack), 0)
+        with self.assertRaises(IndexError):
+            stack.pop()
+
+    def test_span_pop(self):
+        stack = SpanStack('abcdef')
+        for position in [1, 2, 3]:
+            stack.append_position(position)
+        self.assertEqual(stack.pop(), 'd')
+        self.assertEqual(stack._parts, [(1, 3)])
+        stack.append_position(3)
+        self.assertEqual(stack._parts, [(1, 4)])
+        self.assertEqual(stack.get_value(), 'bcd')
+
+    def test_default_stacks(self):
+        classifier = CharClassClassifier(type_classes={'empty': 'empty'})
+        grammar = Grammar('grammars/number.grammar', classifier=classifier)
+        parser = Parser(grammar, SourceString('-123.45e67'))
+        parser.parse()
+        self.assertEqual(parser._stacks['integer'], ['1', '2', '3'])
+        self.assertIsInstance(parser._stacks['integer'], list)
+        self.assertEqual(parser.get_stack_value('fraction'), '45')
+        self.assertEqual(parser.get_stack_value('missing'), '')
+
+    def test_list_reset(self):
+        classifier = CharClassClassifier(char_classes={'ws': ' ', 'a-Z': string.ascii_letters})
+        grammar = Grammar('grammars/words.grammar', classifier=classifier)
+        parser = ListResetParser(grammar, SourceString('one two'))
+        self.assertIsInstance(parser._stacks[''], SpanStack)
+        parser.parse()
+        self.assertIsInstance(parser._stacks[''], list)
+        self.assertEqual(parser.get_stack_value(''), 'two')
+
+    def test_parser_stacks(self):
+        classifier = CharClassClassifier(type_classes={'empty': 'empty'})
+        grammar = Grammar('grammars/number.grammar', classifier=classifier)
+        parser = SpanParser(grammar, SourceString('-123.45e67'))
+        parser.parse()
+        for stack_name, value in [('integer', '123'), ('fraction', '45'), ('exponent', '67')]:
+            self.assertIsInstance(parser._stacks[stack_name], SpanStack)
+            self.assertEqual(len(parser._stacks[stack_name]._parts), 1)
+            self.assertEqual(parser.get_stack_value(stack_name), value)
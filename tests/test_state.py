@@ -1,6 +1,9 @@
 import unittest
 
+from exprail.classifier import CharClassClassifier
 from exprail.grammar import Grammar
+from exprail.parser import Parser
+from exprail.source import SourceString
 from exprail.state import State
 
 
@@ -54,6 +57,15 @@ class StateTest(unittest.TestCase):
         states = token_state.find_successor_states()
         self.assertEqual(states, {token_state, finish_state})
 
+    def test_immutable_successor_states(self):
+        grammar = Grammar('grammars/function.grammar')
+        state = State(grammar, 'function', 7)
+        self.assertIsInstance(state.find_successor_states(), frozenset)
+        self.assertIsInstance(State(grammar, 'function', 1).find_successor_states(), frozenset)
+        grammar.enable_successor_cache()
+        self.assertIsInstance(state.find_successor_states(), frozenset)
+        self.assertIs(state.find_successor_states(), state.find_successor_states())
+
     def test_expression_entry(self):
         grammar = Grammar('grammars/function.grammar')
         source = State(grammar, 'function', 7)
@@ -65,3 +77,49 @@ class StateTest(unittest.TestCase):
         source = State(grammar, 'list', 2, State(grammar, 'function', 7))
         target = State(grammar, 'function', 9)
         self.assertEqual(source.find_successor_states(), {target})
+
+    def test_successor_cache(self):
+        grammar = Grammar('grammars/function.grammar')
+        grammar.enable_successor_cache(maxsize=2)
+        source = State(grammar, 'function', 7)
+        target = State(grammar, 'list', 5, State(grammar, 'function', 7))
+        self.assertEqual(source.find_successor_states(), {target})
+        self.assertEqual(source.find_successor_states(), {target})
+        self.assertEqual(grammar.successor_cache.hits, 1)
+        self.assertEqual(grammar.successor_cache.misses, 1)
+        grammar.disable_successor_cache()
+        self.assertIsNone(grammar.successor_cache)
+
+    def test_uncompiled_successor_cache(self):
+        grammar = Grammar(classifier=CharClassClassifier(type_classes={'empty': 'empty'}))
+        grammar.load_from_file('grammars/number.grammar')
+        grammar.validate()
+        grammar.enable_successor_cache()
+        parser = Parser(grammar, SourceString('-123.45e+6'))
+        parser.parse()
+        self.assertIsNone(grammar.routing_table)
+        self.assertEqual(parser._stacks['fraction'], ['4', '5'])
+        self.assertGreater(grammar.successor_cache.hits, 0)
+        n_misses = grammar.successor_cache.misses
+        parser = Parser(grammar, SourceString('-123.45e+6'))
+        parser.parse()
+        self.assertEqual(grammar.successor_cache.misses, n_misses)
+
+    def test_compilation_successor_cache(self):
+        grammar = Grammar('grammars/number.grammar')
+        grammar.enable_successor_cache()
+        grammar.compile()
+        self.assertGreater(grammar.successor_cache.hits, 0)
+
+    def test_state_interning(self):
+        grammar = Grammar('grammars/function.grammar')
+        grammar.enable_state_interning()
+        return_state = grammar.create_state('function', 7)
+        state = grammar.create_state('list', 5, return_state)
+        self.assertIs(grammar.create_state('function', 7), return_state)
+        self.assertIs(grammar.create_state('list', 5, State(grammar, 'function', 7)), state)
+        self.assertIs(next(iter(return_state.find_successor_states())), state)
+        self.assertEqual(state, State(grammar, 'list', 5, State(grammar, 'function', 7)))
+        self.assertEqual(hash(state), hash(State(grammar, 'list', 5, State(grammar, 'function', 7))))
+        grammar.disable_state_interning()
+        self.assertIsNot(grammar.create_state('function', 7), return_state)
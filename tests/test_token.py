@@ -0,0 +1,57 @@
+import pickle
+import unittest
+
+from exprail.source import Source, SourceString
+from exprail.token import Token, get_char_token
+from exprail import token
+
+
+class TokenTest(unittest.TestCase):
+    """Unittest for the Token class"""
+
+    def test_value_equality(self):
+        self.assertEqual(Token('char', 'a'), Token('char', 'a'))
+        self.assertNotEqual(Token('char', 'a'), Token('char', 'b'))
+        self.assertNotEqual(Token('char', 'a'), Token('name', 'a'))
+        self.assertNotEqual(Token('char', 'a'), ('char', 'a'))
+        self.assertEqual(len({Token('char', 'a'), Token('char', 'a'), Token('empty', '')}), 2)
+
+    def test_immutability(self):
+        char_token = Token('char', 'a')
+        with self.assertRaises(AttributeError):
+            char_token.value = 'b'
+        with self.assertRaises(AttributeError):
+            char_token.position = 1
+
+    def test_representation(self):
+        self.assertEqual(repr(Token('char', 'a')), "<Token('char', 'a')>")
+        self.assertEqual(pickle.loads(pickle.dumps(Token('char', 'a'))), Token('char', 'a'))
+
+    def test_shared_finish_token(self):
+        source = SourceString('')
+        source.parse()
+        self.assertIs(source.get_token(), Source.get_finish_token())
+        self.assertIs(Source.get_finish_token(), Source.get_finish_token())
+
+    def test_char_tokens(self):
+        first_source = SourceString('aé')
+        second_source = SourceString('éa')
+        first_source.parse()
+        second_source.parse()
+        self.assertIs(first_source.get_token(), get_char_token('a'))
+        self.assertIs(second_source.get_token(), get_char_token('é'))
+        first_source.parse()
+        second_source.parse()
+        self.assertIs(first_source.get_token(), get_char_token('é'))
+        self.assertIs(second_source.get_token(), get_char_token('a'))
+        self.assertEqual(get_char_token('中'), Token('char', '中'))
+
+    def test_char_token_limit(self):
+        n_tokens = len(token.CHAR_TOKENS)
+        limit = token.MAX_CHAR_TOKENS
+        token.MAX_CHAR_TOKENS = n_tokens
+        try:
+            self.assertIsNot(get_char_token('丮'), get_char_token('丮'))
+            self.assertEqual(len(token.CHAR_TOKENS), n_tokens)
+        finally:
+            token.MAX_CHAR_TOKENS = limit
@@ -1,9 +1,12 @@
 import unittest
 
+from exprail.classifier import CharClassClassifier, Classifier
 from exprail.expression import Expression
 from exprail.grammar import Grammar
 from exprail.node import Node
 from exprail.node import NodeType
+from exprail.parser import Parser
+from exprail.source import SourceString
 from exprail import validator
 
 
@@ -423,3 +426,60 @@ class ValidatorTest(unittest.TestCase):
         grammar.add_expression('sample', expression)
         with self.assertRaises(RuntimeError):
             validator.check_referenced_expressions(grammar)
+
+
+class CollectingParser(Parser):
+    """Collect the values of the default stack"""
+
+    def __init__(self, grammar, source):
+        super(CollectingParser, self).__init__(grammar, source)
+        self._result = []
+
+    @property
+    def result(self):
+        return self._result
+
+    def operate(self, operation, token):
+        """Save the content of the default stack."""
+        self._result.append(self.get_stack_value(''))
+
+
+class AmbiguityTest(unittest.TestCase):
+    """Unittest for the static ambiguity analysis"""
+
+    def test_uncompiled_grammar(self):
+        grammar = Grammar(classifier=Classifier())
+        grammar.load_from_file('grammars/number.grammar')
+        with self.assertRaises(ValueError):
+            _ = validator.find_ambiguous_nodes(grammar)
+
+    def test_unproven_classes(self):
+        grammar = Grammar('grammars/number.grammar', classifier=Classifier())
+        ambiguous_nodes = validator.find_ambiguous_nodes(grammar)
+        self.assertIn(('number', 30), ambiguous_nodes)
+        self.assertNotIn(('number', 15), ambiguous_nodes)
+        with self.assertRaises(RuntimeError):
+            grammar.enable_trusted_routing()
+        self.assertFalse(grammar.is_trusted())
+
+    def test_overlapping_classes(self):
+        classifier = CharClassClassifier(char_classes={'0-9': '0123456789', '1-9': '123456789', '0': '0'})
+        self.assertFalse(classifier.are_disjoint('0-9', '1-9'))
+        self.assertTrue(classifier.are_disjoint('0', '1-9'))
+        grammar = Grammar('grammars/number.grammar', classifier=CharClassClassifier(type_classes={'empty': 'empty'}))
+        self.assertEqual(validator.find_ambiguous_nodes(grammar), [])
+
+    def test_trusted_routing(self):
+        classifier = CharClassClassifier(char_classes={'ws': ' '})
+        grammar = Grammar('grammars/integer_list.grammar', classifier=classifier)
+        trusted_grammar = Grammar('grammars/integer_list.grammar', classifier=classifier)
+        trusted_grammar.enable_trusted_routing()
+        self.assertTrue(trusted_grammar.is_trusted())
+        for text in ['[12, 3, 456]', '[]', '[7]']:
+            parser = CollectingParser(grammar, SourceString(text))
+            parser.parse()
+            trusted_parser = CollectingParser(trusted_grammar, SourceString(text))
+            trusted_parser.parse()
+            self.assertEqual(trusted_parser.result, parser.result)
+        trusted_grammar.compile()
+        self.assertFalse(trusted_grammar.is_trusted())
@@ -39,7 +39,7 @@ class WsParser(Parser):
     def operate(self, operation, token):
         """Print the token value on print operation."""
         if operation == 'save':
-            word = ''.join(self._stacks[''])
+            word = self.get_stack_value('')
             self._result.append(word)
         else:
             raise ValueError('The "{}" is an invalid operation!'.format(operation))